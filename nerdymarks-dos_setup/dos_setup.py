@@ -18,14 +18,20 @@ import pygame
 import os
 import sys
 import zipfile
+import io
+import json
 import subprocess
 import shutil
 import logging
 import signal
 import atexit
+import time
+import threading
+from collections import OrderedDict, defaultdict, deque
+from contextlib import contextmanager
+from enum import IntEnum
 from pathlib import Path
 from typing import List, Optional, Tuple
-from datetime import datetime
 
 # Add shared module path
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'shared'))
@@ -41,7 +47,7 @@ logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s [%(levelname)s] %(message)s',
     handlers=[
-        logging.FileHandler(LOG_FILE),
+        logging.FileHandler(LOG_FILE, delay=True),
         logging.StreamHandler(sys.stdout)
     ]
 )
@@ -50,8 +56,10 @@ logger = logging.getLogger(__name__)
 # Paths
 DOS_ROM_DIR = "/run/media/deck/SK256/Emulation/roms/dos"
 SAVES_DIR = "/run/media/deck/SK256/Emulation/saves/retroarch/saves"
-RETROARCH_CMD = "flatpak run org.libretro.RetroArch"
+RETROARCH_CMD = ["flatpak", "run", "org.libretro.RetroArch"]
+RETROARCH_LOG = "/tmp/retroarch.stderr.log"
 DOSBOX_PURE_CORE = "/home/deck/.var/app/org.libretro.RetroArch/config/retroarch/cores/dosbox_pure_libretro.so"
+GAMES_CACHE_FILE = os.path.expanduser("~/.cache/nerdymarks-dos/games.json")
 
 # Theme - DOS gets a retro amber/green theme
 THEME = get_theme('dos')
@@ -72,11 +80,28 @@ CYAN = (100, 200, 200)
 SETUP_PATTERNS = ['setup', 'install', 'setsound', 'config', 'setblast']
 SKIP_PATTERNS = ['setup.exe', 'install.exe', 'uninstall.exe', 'config.exe', 'readme.exe',
                  'help.exe', 'order.exe', 'register.exe', 'catalog.exe', 'vendor.exe']
+SKIP_PATTERNS_LOWER = frozenset(p.lower() for p in SKIP_PATTERNS)
 
 # LZH/DEICE installer patterns
 LZH_INSTALLER_FILES = ['deice.exe', 'de-ice.exe', 'ice.exe', 'lha.exe', 'lharc.exe']
 LZH_ARCHIVE_EXTENSIONS = ['.1', '.2', '.3', '.4', '.5', '.6', '.7', '.8', '.9', '.dat', '.lzh', '.lha']
 
+# Events the UI loop acts on; anything else is discarded, and the noisiest
+# types are blocked from entering the SDL queue at all
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION]
+BLOCKED_EVENTS = [pygame.MOUSEMOTION, pygame.JOYAXISMOTION, pygame.JOYBALLMOTION,
+                  pygame.ACTIVEEVENT, pygame.VIDEOEXPOSE]
+
+# Max rendered text Surfaces kept between frames
+TEXT_CACHE_SIZE = 512
+
+# With no input, only the background animation needs redrawing, at a lower rate
+IDLE_FRAME_MS = 50
+
+# Active frame rate, and how many recent frames the pacer averages
+FRAME_TIME = 1 / 60
+PACER_SAMPLES = 120
+
 # Process tracking for cleanup
 _child_processes = []
 _cleanup_done = False
@@ -113,11 +138,7 @@ def track_process(proc):
 
 def check_lha_available() -> bool:
     """Check if lha/lhasa is available for LZH extraction"""
-    try:
-        result = subprocess.run(['which', 'lha'], capture_output=True, text=True)
-        return result.returncode == 0
-    except:
-        return False
+    return shutil.which('lha') is not None
 
 
 def extract_lzh_file(lzh_path: str, dest_dir: str) -> Tuple[bool, str]:
@@ -141,41 +162,244 @@ def extract_lzh_file(lzh_path: str, dest_dir: str) -> Tuple[bool, str]:
         return False, str(e)
 
 
+def write_save_zip(save_path: Path, files) -> None:
+    """Write (name, data) pairs as a new save ZIP, replacing save_path atomically"""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, data in files:
+            zf.writestr(name, data)
+
+    tmp_path = save_path.with_suffix('.zip.tmp')
+    try:
+        tmp_path.write_bytes(buf.getvalue())
+        os.replace(tmp_path, save_path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def append_save_zip(save_path: Path, name: str, data) -> None:
+    """Add one file to an existing save ZIP, replacing save_path atomically"""
+    # The existing members are copied as raw bytes, so nothing is re-inflated
+    tmp_path = save_path.with_suffix('.zip.tmp')
+    try:
+        shutil.copyfile(save_path, tmp_path)
+        with zipfile.ZipFile(tmp_path, 'a', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(name, data)
+        os.replace(tmp_path, save_path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class FrameProfiler:
+    """Per-frame timing of named, nestable spans for the F3 debug overlay"""
+
+    def __init__(self, frames: int = PACER_SAMPLES):
+        self.enabled = False
+        self.history = {}
+        self._frames = frames
+        self._current = defaultdict(int)
+        self._stack = []
+
+    @contextmanager
+    def span(self, name: str):
+        """Time the enclosed block; nested spans are recorded as parent/child"""
+        if not self.enabled:
+            yield
+            return
+        self._stack.append(name)
+        key = "/".join(self._stack)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._current[key] += time.perf_counter_ns() - start
+            self._stack.pop()
+
+    def end_frame(self):
+        for key, ns in self._current.items():
+            if key not in self.history:
+                self.history[key] = deque(maxlen=self._frames)
+            self.history[key].append(ns)
+        self._current.clear()
+
+    def discard_frame(self):
+        """Drop the spans timed since the last frame without recording them"""
+        self._current.clear()
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.history.clear()
+        self._current.clear()
+
+    def top_spans(self, count: int = 5) -> List[Tuple[str, float]]:
+        """The slowest spans as (name, average ms per frame)"""
+        averages = [(key, sum(h) / len(h) / 1e6) for key, h in self.history.items()]
+        averages.sort(key=lambda item: item[1], reverse=True)
+        return averages[:count]
+
+
+class View(IntEnum):
+    """UI screens; values index the per-view handler tables"""
+    LIST = 0
+    DETAIL = 1
+    EXE_SELECT = 2
+
+
+def load_games_cache() -> dict:
+    """Load cached ZIP scan results, keyed by ZIP path"""
+    try:
+        with open(GAMES_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable games cache: {e}")
+        return {}
+
+
+def save_games_cache(cache: dict):
+    """Write ZIP scan results back to the games cache"""
+    try:
+        os.makedirs(os.path.dirname(GAMES_CACHE_FILE), exist_ok=True)
+        tmp_path = GAMES_CACHE_FILE + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, GAMES_CACHE_FILE)
+    except Exception as e:
+        logger.error(f"Error saving games cache: {e}")
+
+
 class DOSGame:
     """Represents a DOS game ZIP file"""
 
-    def __init__(self, zip_path: Path):
+    def __init__(self, zip_path: Path, stat: Optional[os.stat_result] = None,
+                 cached: Optional[dict] = None):
         self.zip_path = zip_path
         self.name = zip_path.stem
-        self.executables: List[str] = []
-        self.setup_exes: List[str] = []
-        self.game_exes: List[str] = []
+        self.name_lc = self.name.lower()
         self.autoboot_exe: Optional[str] = None
         self.is_configured = False
 
+        # ZIP contents - scanned on first access (see _scan_once)
+        self._scanned = False
+        self._scan_lock = threading.Lock()
+        self._executables: List[str] = []
+        self._exes_lower: List[str] = []
+        self._setup_exes: List[str] = []
+        self._game_exes: List[str] = []
+
         # LZH installer detection
-        self.has_lzh_installer = False
-        self.lzh_decompressor: Optional[str] = None
-        self.lzh_archives: List[str] = []
+        self._has_lzh_installer = False
+        self._lzh_decompressor: Optional[str] = None
+        self._lzh_archives: List[str] = []
+
+        # Name words used to match the main executable, and the cached match
+        self._name_tokens = tuple(w for w in self.name.lower().split()[:2] if len(w) > 3)
+        self._likely_exe: Optional[str] = None
+
+        # Reuse a cached scan if the ZIP hasn't changed since it was recorded
+        self._mtime = stat.st_mtime if stat else None
+        self._size = stat.st_size if stat else None
+        if cached and stat and cached.get('mtime') == self._mtime and cached.get('size') == self._size:
+            self._load_cached_scan(cached)
 
         # Save data detection
         self.has_save_data = False
         self.save_file_count = 0
         self.save_size_kb = 0
 
-        self._scan_contents()
         self._check_configured()
         self._check_save_data()
 
-        logger.debug(f"Loaded: {self.name} - {len(self.executables)} exes, "
-                     f"lzh={self.has_lzh_installer}, configured={self.is_configured}, "
+        logger.debug(f"Loaded: {self.name} - configured={self.is_configured}, "
                      f"save_data={self.has_save_data}")
 
+    @property
+    def scanned(self) -> bool:
+        return self._scanned
+
+    @property
+    def executables(self) -> List[str]:
+        self._scan_once()
+        return self._executables
+
+    @property
+    def setup_exes(self) -> List[str]:
+        self._scan_once()
+        return self._setup_exes
+
+    @property
+    def game_exes(self) -> List[str]:
+        self._scan_once()
+        return self._game_exes
+
+    @property
+    def has_lzh_installer(self) -> bool:
+        self._scan_once()
+        return self._has_lzh_installer
+
+    @property
+    def lzh_decompressor(self) -> Optional[str]:
+        self._scan_once()
+        return self._lzh_decompressor
+
+    @property
+    def lzh_archives(self) -> List[str]:
+        self._scan_once()
+        return self._lzh_archives
+
+    def _load_cached_scan(self, cached: dict):
+        self._executables = cached['executables']
+        self._exes_lower = [e.lower() for e in self._executables]
+        self._setup_exes = cached['setup_exes']
+        self._game_exes = cached['game_exes']
+        self._has_lzh_installer = cached['has_lzh_installer']
+        self._lzh_decompressor = cached['lzh_decompressor']
+        self._lzh_archives = cached['lzh_archives']
+        self._scanned = True
+
+    def cache_entry(self) -> Optional[dict]:
+        """Scan results for the games cache, or None if the ZIP hasn't been scanned"""
+        if not self._scanned or self._mtime is None:
+            return None
+        return {
+            'mtime': self._mtime,
+            'size': self._size,
+            'executables': self._executables,
+            'setup_exes': self._setup_exes,
+            'game_exes': self._game_exes,
+            'has_lzh_installer': self._has_lzh_installer,
+            'lzh_decompressor': self._lzh_decompressor,
+            'lzh_archives': self._lzh_archives,
+        }
+
+    def scan(self):
+        """Scan the game ZIP now unless its contents are already known"""
+        self._scan_once()
+
+    def _scan_once(self):
+        """Scan the game ZIP the first time its contents are needed"""
+        if self._scanned:
+            return
+        # The loader thread scans in the background; only flag the lists once they're complete
+        with self._scan_lock:
+            if self._scanned:
+                return
+            self._scan_contents()
+            self._scanned = True
+        logger.debug(f"Scanned: {self.name} - {len(self._executables)} exes, "
+                     f"lzh={self._has_lzh_installer}")
+
     def _scan_contents(self):
         """Scan ZIP for executable files and LZH installers"""
         try:
             with zipfile.ZipFile(self.zip_path, 'r') as zf:
-                for name in zf.namelist():
+                for info in zf.infolist():
+                    if info.is_dir():
+                        continue
+                    name = info.filename
                     lower = name.lower()
                     basename = os.path.basename(name)
                     basename_lower = basename.lower()
@@ -183,27 +407,28 @@ class DOSGame:
                     # Check for executables
                     if lower.endswith(('.exe', '.bat', '.com')):
                         if basename:
-                            self.executables.append(basename)
+                            self._executables.append(basename)
+                            self._exes_lower.append(basename_lower)
                             if any(p in lower for p in SETUP_PATTERNS):
-                                self.setup_exes.append(basename)
-                            elif basename_lower not in [p.lower() for p in SKIP_PATTERNS]:
-                                self.game_exes.append(basename)
+                                self._setup_exes.append(basename)
+                            elif basename_lower not in SKIP_PATTERNS_LOWER:
+                                self._game_exes.append(basename)
 
                             # Check for LZH decompressor
                             if basename_lower in LZH_INSTALLER_FILES:
-                                self.has_lzh_installer = True
-                                self.lzh_decompressor = basename
+                                self._has_lzh_installer = True
+                                self._lzh_decompressor = basename
 
                     # Check for LZH archives
                     ext = os.path.splitext(lower)[1]
                     if ext in LZH_ARCHIVE_EXTENSIONS:
-                        self.lzh_archives.append(basename)
+                        self._lzh_archives.append(basename)
 
                 # If we have LZH archives but no decompressor detected, still flag it
-                if self.lzh_archives and not self.has_lzh_installer:
+                if self._lzh_archives and not self._has_lzh_installer:
                     # Check if there's an install.bat that might use deice
-                    if any('install' in e.lower() for e in self.executables):
-                        self.has_lzh_installer = True
+                    if any('install' in e.lower() for e in self._executables):
+                        self._has_lzh_installer = True
 
         except Exception as e:
             logger.error(f"Error scanning {self.zip_path}: {e}")
@@ -214,8 +439,9 @@ class DOSGame:
         if save_path.exists():
             try:
                 with zipfile.ZipFile(save_path, 'r') as zf:
-                    if 'AUTOBOOT.DBP' in zf.namelist():
-                        content = zf.read('AUTOBOOT.DBP').decode('utf-8', errors='ignore').strip()
+                    info = zf.NameToInfo.get('AUTOBOOT.DBP')
+                    if info is not None:
+                        content = zf.read(info).decode('utf-8', errors='ignore').strip()
                         if content:
                             self.autoboot_exe = content
                             self.is_configured = True
@@ -230,34 +456,38 @@ class DOSGame:
                 self.save_size_kb = save_path.stat().st_size // 1024
                 with zipfile.ZipFile(save_path, 'r') as zf:
                     # Count files excluding AUTOBOOT.DBP
-                    files = [n for n in zf.namelist() if n != 'AUTOBOOT.DBP']
-                    self.save_file_count = len(files)
+                    self.save_file_count = sum(1 for info in zf.infolist()
+                                               if info.filename != 'AUTOBOOT.DBP')
                     self.has_save_data = self.save_file_count > 0
             except Exception as e:
                 logger.error(f"Error checking save data for {self.name}: {e}")
 
     def get_likely_game_exe(self) -> Optional[str]:
         """Guess the most likely main game executable"""
-        if len(self.executables) == 1:
-            return self.executables[0]
-
-        non_setup = [e for e in self.executables
-                     if e.lower() not in [p.lower() for p in SKIP_PATTERNS]
-                     and e.lower() not in LZH_INSTALLER_FILES]
+        if self._likely_exe is None:
+            self._likely_exe = self._find_likely_game_exe()
+        return self._likely_exe
+
+    def _find_likely_game_exe(self) -> Optional[str]:
+        executables = self.executables
+        if len(executables) == 1:
+            return executables[0]
+
+        non_setup = [(e, lower) for e, lower in zip(executables, self._exes_lower)
+                     if lower not in SKIP_PATTERNS_LOWER
+                     and lower not in LZH_INSTALLER_FILES]
         if len(non_setup) == 1:
-            return non_setup[0]
+            return non_setup[0][0]
 
         # Check if game name is in executable name
-        for exe in non_setup or self.executables:
-            lower = exe.lower()
-            game_words = self.name.lower().split()[0:2]
-            for word in game_words:
-                if len(word) > 3 and word in lower:
+        for exe, lower in non_setup or zip(executables, self._exes_lower):
+            for word in self._name_tokens:
+                if word in lower:
                     return exe
 
         if non_setup:
-            return non_setup[0]
-        return self.executables[0] if self.executables else None
+            return non_setup[0][0]
+        return executables[0] if executables else None
 
     def get_install_status(self) -> Tuple[str, Tuple[int, int, int]]:
         """Get installation status label and color"""
@@ -267,6 +497,8 @@ class DOSGame:
             return "[CFG]", CYAN
         elif self.has_save_data:
             return "[DATA]", BLUE
+        elif not self._scanned:
+            return "[..]", SMOKE_GRAY
         elif self.has_lzh_installer:
             return "[LZH]", ORANGE
         elif self.setup_exes:
@@ -287,14 +519,21 @@ class DOSGame:
             existing_files = {}
             if save_path.exists():
                 with zipfile.ZipFile(save_path, 'r') as zf:
-                    for name in zf.namelist():
-                        if name != 'AUTOBOOT.DBP':
-                            existing_files[name] = zf.read(name)
-
-            with zipfile.ZipFile(save_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                zf.writestr('AUTOBOOT.DBP', autoboot_content)
-                for name, data in existing_files.items():
-                    zf.writestr(name, data)
+                    has_autoboot = 'AUTOBOOT.DBP' in zf.NameToInfo
+                    if has_autoboot:
+                        for info in zf.infolist():
+                            if info.filename != 'AUTOBOOT.DBP':
+                                existing_files[info.filename] = zf.read(info)
+
+                # No AUTOBOOT.DBP yet - append it instead of inflating and
+                # re-deflating (and CRC-checking) every installed file
+                if not has_autoboot:
+                    append_save_zip(save_path, 'AUTOBOOT.DBP', autoboot_content)
+                    self.autoboot_exe = autoboot_content
+                    self.is_configured = True
+                    return True
+
+            write_save_zip(save_path, [('AUTOBOOT.DBP', autoboot_content), *existing_files.items()])
 
             self.autoboot_exe = autoboot_content
             self.is_configured = True
@@ -315,14 +554,12 @@ class DOSGame:
         try:
             existing_files = {}
             with zipfile.ZipFile(save_path, 'r') as zf:
-                for name in zf.namelist():
-                    if name != 'AUTOBOOT.DBP':
-                        existing_files[name] = zf.read(name)
+                for info in zf.infolist():
+                    if info.filename != 'AUTOBOOT.DBP':
+                        existing_files[info.filename] = zf.read(info)
 
             if existing_files:
-                with zipfile.ZipFile(save_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                    for name, data in existing_files.items():
-                        zf.writestr(name, data)
+                write_save_zip(save_path, existing_files.items())
             else:
                 save_path.unlink()
 
@@ -356,11 +593,17 @@ class DOSSetupUI:
     def __init__(self):
         pygame.init()
         pygame.joystick.init()
+        # Stick axes are polled in check_input, so their motion events are never needed
+        pygame.event.set_blocked(BLOCKED_EVENTS)
 
         info = pygame.display.Info()
         self.width = info.current_w
         self.height = info.current_h
-        self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
+        # No vsync: this is a menu, so input shouldn't wait behind a vblank.
+        # Frame pacing comes from the run loop instead. SCALED presents through
+        # SDL's GPU renderer rather than a CPU framebuffer copy.
+        self.screen = pygame.display.set_mode((self.width, self.height),
+                                              pygame.FULLSCREEN | pygame.SCALED, vsync=0)
         pygame.display.set_caption("nerdymark's DOS Setup Tool")
 
         self.font_large = pygame.font.Font(None, 48)
@@ -368,6 +611,7 @@ class DOSSetupUI:
         self.font_small = pygame.font.Font(None, 28)
         self.font_tiny = pygame.font.Font(None, 22)
         self.font_brand = pygame.font.Font(None, 24)
+        self._text_cache: OrderedDict = OrderedDict()
 
         self.joystick = None
         if pygame.joystick.get_count() > 0:
@@ -375,12 +619,19 @@ class DOSSetupUI:
             self.joystick.init()
 
         self.games: List[DOSGame] = []
+        self.scanning = False
+        self.scanning_contents = False
+        self._games_lock = threading.Lock()
+        self._loaded_games: Optional[List[DOSGame]] = None
+        # Games on screen whose ZIPs the loader thread should scan next
+        self._scan_requests: deque = deque()
+        self._scan_queued = set()
         self.filtered_games: List[DOSGame] = []
         self.selected_index = 0
         self.scroll_offset = 0
         self.visible_items = (self.height - 280) // 35
 
-        self.view_mode = "list"
+        self.view_mode = View.LIST
         self.selected_game: Optional[DOSGame] = None
         self.exe_select_index = 0
 
@@ -396,13 +647,64 @@ class DOSSetupUI:
         ]
         self.key_row = 0
         self.key_col = 0
+        self._kb_bg: Optional[pygame.Surface] = None
 
         self.status_message = ""
+        self._status_surf: Optional[pygame.Surface] = None
+        self._status_pos = (0, 0)
         self.status_time = 0
         self.last_input_time = 0
         self.input_delay = 150
         self.clock = pygame.time.Clock()
 
+        # Screen regions touched this frame, pushed to the display by present()
+        self._dirty_rects: List[pygame.Rect] = []
+        self._needs_redraw = True
+        self._last_draw_time = 0
+        self._frame_work = deque(maxlen=PACER_SAMPLES)
+        self.prof = FrameProfiler()
+
+        # Per-view draw and navigation handlers, indexed by View
+        self._draw_fns = [
+            self.draw_list_view,
+            self.draw_detail_view,
+            self.draw_exe_select,
+        ]
+        self._input_fns = [
+            self.handle_list_input,
+            None,
+            self.handle_exe_select_input,
+        ]
+
+        # Joystick button handlers per view, plus the on-screen keyboard's while it's open
+        self.running = False
+        self._kb_btn_handlers = {
+            0: self.handle_keyboard_select,
+            1: self._act_close_keyboard,
+        }
+        self._btn_handlers = [
+            {  # View.LIST
+                0: self._act_open_detail,
+                1: self._act_quit,
+                2: self._act_quick_config,
+                3: self._act_open_keyboard,
+                4: lambda: self.cycle_filter(-1),
+                5: lambda: self.cycle_filter(1),
+                6: self._act_update,  # SELECT
+            },
+            {  # View.DETAIL
+                0: self._act_open_exe_select,
+                1: self._act_back_to_list,
+                2: self._act_launch,
+                3: self._act_launch,
+                5: self._act_clear_save_data,  # R1
+            },
+            {  # View.EXE_SELECT
+                0: self._act_confirm_exe,
+                1: self._act_back_to_detail,
+            },
+        ]
+
         # Gloomy background
         self.background = GloomyBackground(self.width, self.height, accent_color=ACCENT)
 
@@ -415,59 +717,152 @@ class DOSSetupUI:
         if not self.lha_available:
             logger.warning("lha command not found - LZH pre-extraction disabled")
 
-    def load_games(self):
-        """Load all DOS game ZIPs"""
+    def start_loading(self):
+        """Load the game library on a background thread; the UI picks it up as it arrives"""
         self.games = []
+        self.scanning = True
+        self.scanning_contents = True
+        threading.Thread(target=self.load_games, daemon=True).start()
+
+    def load_games(self):
+        """Load all DOS game ZIPs, publishing them to the UI in batches"""
+        games: List[DOSGame] = []
         dos_path = Path(DOS_ROM_DIR)
         logger.info(f"Loading games from {dos_path}")
 
-        if dos_path.exists():
-            zips = sorted(dos_path.glob("*.zip"), key=lambda x: x.name.lower())
-            total = len(zips)
-            logger.info(f"Found {total} DOS game ZIPs")
-
-            for i, zip_path in enumerate(zips):
-                if i % 100 == 0:
-                    self.draw_loading(f"Loading games... {i}/{total}")
-                    pygame.display.flip()
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            return
-                self.games.append(DOSGame(zip_path))
-
-            configured = sum(1 for g in self.games if g.is_configured)
-            lzh_games = sum(1 for g in self.games if g.has_lzh_installer)
-            logger.info(f"Loaded {len(self.games)} games, {configured} configured, {lzh_games} with LZH installers")
-        else:
-            logger.warning(f"DOS ROM directory not found: {dos_path}")
-
-        self.apply_filter()
+        try:
+            if dos_path.exists():
+                with os.scandir(dos_path) as it:
+                    zips = sorted((e for e in it if e.name.lower().endswith('.zip') and e.is_file()),
+                                  key=lambda e: e.name.lower())
+                logger.info(f"Found {len(zips)} DOS game ZIPs")
+
+                cache = load_games_cache()
+                for i, entry in enumerate(zips):
+                    games.append(DOSGame(Path(entry.path), entry.stat(), cache.get(entry.path)))
+                    if self._scan_requests:
+                        self._scan_requested()
+                    if i & 63 == 63:
+                        self._publish_games(games)
+
+                configured = sum(1 for g in games if g.is_configured)
+                logger.info(f"Loaded {len(games)} games, {configured} configured")
+            else:
+                logger.warning(f"DOS ROM directory not found: {dos_path}")
+        except Exception as e:
+            logger.error(f"Error loading games: {e}")
+        finally:
+            self._publish_games(games, done=True)
+        self.scan_contents(games)
+
+    def scan_contents(self, games: List[DOSGame]):
+        """Scan every uncached ZIP off the UI thread, visible rows first"""
+        pending = deque(g for g in games if not g.scanned)
+        logger.info(f"Scanning {len(pending)} uncached game ZIPs")
+        count = 0
+        try:
+            while pending:
+                if self._scan_requests:
+                    self._scan_requested()
+                    self._publish_games(games)
+                    continue
+                game = pending.popleft()
+                if game.scanned:
+                    continue
+                game.scan()
+                count += 1
+                if count & 63 == 0:
+                    self._publish_games(games)
+        except Exception as e:
+            logger.error(f"Error scanning games: {e}")
+        finally:
+            self._publish_games(games, contents_done=True)
+
+    def _scan_requested(self):
+        """Scan the games the list view asked for, in the order it asked"""
+        while self._scan_requests:
+            game = self._scan_requests.popleft()
+            game.scan()
+            self._scan_queued.discard(game)
+
+    def request_scan(self, game: DOSGame):
+        """Queue an on-screen game's ZIP for the loader thread to scan next"""
+        if game not in self._scan_queued:
+            self._scan_queued.add(game)
+            self._scan_requests.append(game)
+
+    def _publish_games(self, games: List[DOSGame], done: bool = False,
+                       contents_done: bool = False):
+        with self._games_lock:
+            self._loaded_games = list(games)
+            if done:
+                self.scanning = False
+            if contents_done:
+                self.scanning_contents = False
+
+    def poll_loaded_games(self):
+        """Adopt any games the loader thread has published since the last frame"""
+        with self._games_lock:
+            loaded = self._loaded_games
+            self._loaded_games = None
+        if loaded is not None:
+            self.games = loaded
+            self.apply_filter(reset_selection=False)
+            self._needs_redraw = True
+
+    def save_games_cache(self):
+        """Persist scan results for every game scanned so far"""
+        cache = {}
+        for game in self.games:
+            entry = game.cache_entry()
+            if entry is not None:
+                cache[str(game.zip_path)] = entry
+        save_games_cache(cache)
 
-    def apply_filter(self):
+    def apply_filter(self, reset_selection: bool = True):
         search = self.search_text.lower()
-        self.filtered_games = []
-        for game in self.games:
-            if search and search not in game.name.lower():
-                continue
-            if self.filter_mode == "unconfigured" and game.is_configured:
-                continue
-            if self.filter_mode == "configured" and not game.is_configured:
-                continue
-            if self.filter_mode == "needs_setup" and not game.setup_exes:
-                continue
-            if self.filter_mode == "needs_install" and not game.has_lzh_installer:
-                continue
-            if self.filter_mode == "has_data" and not game.has_save_data:
-                continue
-            self.filtered_games.append(game)
-        self.selected_index = 0
-        self.scroll_offset = 0
+        games = self.games
+        if search:
+            games = [g for g in games if search in g.name_lc]
+
+        mode = self.filter_mode
+        if mode == "unconfigured":
+            games = [g for g in games if not g.is_configured]
+        elif mode == "configured":
+            games = [g for g in games if g.is_configured]
+        elif mode == "needs_setup":
+            games = [g for g in games if g.scanned and g.setup_exes]
+        elif mode == "needs_install":
+            games = [g for g in games if g.scanned and g.has_lzh_installer]
+        elif mode == "has_data":
+            games = [g for g in games if g.has_save_data]
+
+        self.filtered_games = list(games)
+        if reset_selection:
+            self.selected_index = 0
+            self.scroll_offset = 0
+        else:
+            self.selected_index = min(self.selected_index, max(0, len(self.filtered_games) - 1))
+
+    def _render(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """Render antialiased text, reusing the Surface from earlier frames"""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            # Match the display's pixel format once so every later blit takes the fast path
+            surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surf
 
     def draw_loading(self, message: str):
         self.background.update()
         self.background.draw(self.screen)
         draw_title_with_glow(self.screen, self.font_large, "NERDYMARK'S DOS SETUP", ACCENT, self.height // 2 - 50)
-        msg_surf = self.font_medium.render(message, True, PALE_GRAY)
+        msg_surf = self._render(self.font_medium, message, PALE_GRAY)
         self.screen.blit(msg_surf, (self.width // 2 - msg_surf.get_width() // 2, self.height // 2 + 10))
         draw_nerdymark_brand(self.screen, self.font_brand, ACCENT_DIM)
 
@@ -475,21 +870,48 @@ class DOSSetupUI:
         self.background.update()
         self.background.draw(self.screen)
         draw_title_with_glow(self.screen, self.font_large, title, ACCENT, self.height // 2 - 50)
-        msg_surf = self.font_medium.render(message, True, PALE_GRAY)
+        msg_surf = self._render(self.font_medium, message, PALE_GRAY)
         self.screen.blit(msg_surf, (self.width // 2 - msg_surf.get_width() // 2, self.height // 2 + 10))
         draw_nerdymark_brand(self.screen, self.font_brand, ACCENT_DIM)
 
-    def draw_status(self):
-        if self.status_message and pygame.time.get_ticks() - self.status_time < 4000:
-            surf = self.font_medium.render(self.status_message, True, YELLOW)
-            panel = create_panel(surf.get_width() + 40, 40, border_color=ACCENT_DIM)
-            self.screen.blit(panel, (self.width // 2 - surf.get_width() // 2 - 20, self.height - 95))
-            self.screen.blit(surf, (self.width // 2 - surf.get_width() // 2, self.height - 90))
+    def draw_status(self) -> Optional[pygame.Rect]:
+        if self._status_surf and pygame.time.get_ticks() - self.status_time < 4000:
+            return self.screen.blit(self._status_surf, self._status_pos)
+        return None
+
+    def present(self):
+        """Update the display with this frame's dirty regions"""
+        rects = self._dirty_rects
+        if not rects:
+            return
+        # Many or large regions are cheaper as a single full-surface update
+        total_area = sum(r.width * r.height for r in rects)
+        if len(rects) > 40 or total_area > self.width * self.height // 4:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
+        rects.clear()
+
+    def pace_frame(self, work_time: float):
+        """Sleep out the rest of the frame, budgeting for the recent average work time"""
+        self._frame_work.append(work_time)
+        predicted = sum(self._frame_work) / len(self._frame_work)
+        sleep_ms = int((FRAME_TIME - predicted) * 1000)
+        if sleep_ms > 0:
+            pygame.time.wait(sleep_ms)
 
     def set_status(self, message: str):
         self.status_message = message
         self.status_time = pygame.time.get_ticks()
 
+        # Pre-render the strip once so each frame's redraw is a single blit
+        surf = self._render(self.font_medium, message, YELLOW)
+        panel = create_panel(surf.get_width() + 40, 40, border_color=ACCENT_DIM)
+        panel.blit(surf, (20, 5))
+        self._status_surf = panel.convert_alpha()
+        self._status_pos = (self.width // 2 - surf.get_width() // 2 - 20, self.height - 95)
+        self._needs_redraw = True
+
     def draw_update_banner(self):
         """Draw update available notification banner at top of screen"""
         if not self.update_banner_visible:
@@ -500,7 +922,7 @@ class DOSSetupUI:
         msg = self.update_checker.message
         if self.update_checker.can_update:
             msg += " - Press SELECT to update"
-        text_surf = self.font_tiny.render(msg, True, (255, 220, 100))
+        text_surf = self._render(self.font_tiny, msg, (255, 220, 100))
         banner_surface.blit(text_surf, (self.width // 2 - text_surf.get_width() // 2, 6))
         self.screen.blit(banner_surface, (0, 0))
 
@@ -527,17 +949,17 @@ class DOSSetupUI:
             draw_title_with_glow(self.screen, self.font_large, "UPDATE AVAILABLE", ACCENT, self.height // 2 - 100)
 
             msg = f"{self.update_checker._status['behind']} new commits available"
-            msg_surf = self.font_medium.render(msg, True, PALE_GRAY)
+            msg_surf = self._render(self.font_medium, msg, PALE_GRAY)
             self.screen.blit(msg_surf, (self.width // 2 - msg_surf.get_width() // 2, self.height // 2 - 40))
 
             for i, opt in enumerate(options):
                 y = self.height // 2 + 20 + i * 50
                 color = ACCENT if i == selected else MIST_GRAY
-                opt_surf = self.font_medium.render(f"{'> ' if i == selected else '  '}{opt}", True, color)
+                opt_surf = self._render(self.font_medium, f"{'> ' if i == selected else '  '}{opt}", color)
                 self.screen.blit(opt_surf, (self.width // 2 - opt_surf.get_width() // 2, y))
 
             draw_nerdymark_brand(self.screen, self.font_brand, ACCENT_DIM)
-            pygame.display.flip()
+            pygame.display.update()
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -591,7 +1013,7 @@ class DOSSetupUI:
             pygame.time.wait(3000)
             return False
 
-    def draw_main_list(self):
+    def draw_main_list(self) -> pygame.Rect:
         self.background.update()
         self.background.draw(self.screen)
 
@@ -599,9 +1021,16 @@ class DOSSetupUI:
 
         # Stats
         configured = sum(1 for g in self.games if g.is_configured)
-        lzh_count = sum(1 for g in self.games if g.has_lzh_installer)
-        stats = f"{len(self.games)} games | {configured} configured | {lzh_count} need install | {len(self.filtered_games)} shown"
-        stats_surf = self.font_small.render(stats, True, MIST_GRAY)
+        # Only count games whose ZIPs have been scanned so drawing doesn't scan the library
+        lzh_count = sum(1 for g in self.games if g.scanned and g.has_lzh_installer)
+        # Until every ZIP is scanned the count is only a lower bound
+        partial = "+" if self.scanning_contents else ""
+        stats = f"{len(self.games)} games | {configured} configured | {lzh_count}{partial} need install | {len(self.filtered_games)} shown"
+        if self.scanning:
+            stats += " | Scanning..."
+        elif self.scanning_contents:
+            stats += " | Scanning ZIPs..."
+        stats_surf = self._render(self.font_small, stats, MIST_GRAY)
         self.screen.blit(stats_surf, (self.width // 2 - stats_surf.get_width() // 2, 60))
 
         # Filter indicator
@@ -615,14 +1044,14 @@ class DOSSetupUI:
         }
         filter_text = f"Filter: {filter_labels.get(self.filter_mode, self.filter_mode.upper())}"
         filter_color = YELLOW if self.filter_mode != "all" else MIST_GRAY
-        filter_surf = self.font_small.render(filter_text, True, filter_color)
+        filter_surf = self._render(self.font_small, filter_text, filter_color)
         self.screen.blit(filter_surf, (50, 95))
 
         # Search box
         search_panel = create_panel(self.width - 300, 30, border_color=ACCENT_DIM if self.keyboard_active else SMOKE_GRAY)
         self.screen.blit(search_panel, (250, 90))
         search_label = f"Search: {self.search_text}" + ("_" if not self.keyboard_active else "")
-        search_surf = self.font_small.render(search_label, True, HIGHLIGHT if self.search_text else PALE_GRAY)
+        search_surf = self._render(self.font_small, search_label, HIGHLIGHT if self.search_text else PALE_GRAY)
         self.screen.blit(search_surf, (260, 95))
 
         # Game list panel
@@ -630,6 +1059,7 @@ class DOSSetupUI:
         self.screen.blit(list_panel, (40, 130))
 
         list_top = 138
+        row_blits = []
         for i in range(self.visible_items):
             idx = i + self.scroll_offset
             if idx >= len(self.filtered_games):
@@ -641,18 +1071,21 @@ class DOSSetupUI:
             if idx == self.selected_index:
                 highlight = pygame.Surface((self.width - 100, 33), pygame.SRCALPHA)
                 pygame.draw.rect(highlight, (*ACCENT_DIM, 120), (0, 0, self.width - 100, 33), border_radius=3)
-                self.screen.blit(highlight, (50, y))
+                row_blits.append((highlight, (50, y)))
 
             # Status indicator
             indicator, ind_color = game.get_install_status()
-            ind_surf = self.font_tiny.render(indicator, True, ind_color)
-            self.screen.blit(ind_surf, (60, y + 8))
+            if not game.scanned:
+                self.request_scan(game)
+            row_blits.append((self._render(self.font_tiny, indicator, ind_color), (60, y + 8)))
 
             # Game name
             name = game.name[:70] + "..." if len(game.name) > 70 else game.name
             color = HIGHLIGHT if idx == self.selected_index else PALE_GRAY
-            name_surf = self.font_small.render(name, True, color)
-            self.screen.blit(name_surf, (130, y + 6))
+            row_blits.append((self._render(self.font_small, name, color), (130, y + 6)))
+
+        # One call for every visible row instead of a Python->C round trip per blit
+        self.screen.blits(row_blits, doreturn=False)
 
         # Scrollbar
         if len(self.filtered_games) > self.visible_items:
@@ -673,24 +1106,51 @@ class DOSSetupUI:
         ]
         x = 50
         for indicator, desc, color in legend_items:
-            ind_surf = self.font_tiny.render(indicator, True, color)
+            ind_surf = self._render(self.font_tiny, indicator, color)
             self.screen.blit(ind_surf, (x, legend_y))
-            desc_surf = self.font_tiny.render(desc, True, MIST_GRAY)
+            desc_surf = self._render(self.font_tiny, desc, MIST_GRAY)
             self.screen.blit(desc_surf, (x + ind_surf.get_width() + 5, legend_y))
             x += ind_surf.get_width() + desc_surf.get_width() + 25
 
         # Controls
         controls = "[A] Details  [X] Quick Config  [Y] Search  [LB/RB] Filter  [B] Quit"
-        controls_surf = self.font_small.render(controls, True, MIST_GRAY)
+        controls_surf = self._render(self.font_small, controls, MIST_GRAY)
         self.screen.blit(controls_surf, (self.width // 2 - controls_surf.get_width() // 2, self.height - 40))
 
         draw_nerdymark_brand(self.screen, self.font_brand, ACCENT_DIM)
         self.draw_update_banner()
         self.draw_status()
-
-    def draw_detail_view(self):
+        # The animated background repaints the whole screen
+        return self.screen.get_rect()
+
+    def draw_list_view(self) -> pygame.Rect:
+        with self.prof.span("main_list"):
+            dirty = self.draw_main_list()
+        if self.keyboard_active:
+            with self.prof.span("keyboard"):
+                dirty = dirty.union(self.draw_keyboard())
+        return dirty
+
+    def draw_profiler(self) -> pygame.Rect:
+        """Draw the slowest frame spans as bars scaled to the frame budget"""
+        spans = self.prof.top_spans()
+        panel_w = 320
+        panel = create_panel(panel_w, 20 + 22 * max(1, len(spans)), border_color=ACCENT_DIM)
+        x = self.width - panel_w - 10
+        dirty = self.screen.blit(panel, (x, 40))
+
+        budget_ms = FRAME_TIME * 1000
+        for i, (name, ms) in enumerate(spans):
+            y = 50 + i * 22
+            bar_w = int(min(1.0, ms / budget_ms) * (panel_w - 20))
+            pygame.draw.rect(self.screen, ACCENT_DIM, (x + 10, y, bar_w, 18))
+            label = self._render(self.font_tiny, f"{name} {ms:.2f} ms", FOG_WHITE)
+            self.screen.blit(label, (x + 14, y + 2))
+        return dirty
+
+    def draw_detail_view(self) -> Optional[pygame.Rect]:
         if not self.selected_game:
-            return
+            return None
 
         self.background.update()
         self.background.draw(self.screen)
@@ -699,7 +1159,7 @@ class DOSSetupUI:
         draw_title_with_glow(self.screen, self.font_large, "GAME DETAILS", ACCENT, 15)
 
         # Game name
-        name_surf = self.font_medium.render(game.name[:55], True, FOG_WHITE)
+        name_surf = self._render(self.font_medium, game.name[:55], FOG_WHITE)
         self.screen.blit(name_surf, (50, 70))
 
         # Status panel
@@ -713,7 +1173,7 @@ class DOSSetupUI:
         else:
             status = "Not configured - needs autoboot executable set"
             status_color = ORANGE
-        status_surf = self.font_small.render(status, True, status_color)
+        status_surf = self._render(self.font_small, status, status_color)
         self.screen.blit(status_surf, (60, y))
 
         y += 25
@@ -723,38 +1183,38 @@ class DOSSetupUI:
         else:
             save_info = "No save data - Game may need installation first"
             save_color = MIST_GRAY
-        save_surf = self.font_small.render(save_info, True, save_color)
+        save_surf = self._render(self.font_small, save_info, save_color)
         self.screen.blit(save_surf, (60, y))
 
         y += 25
         if game.has_lzh_installer:
             lzh_info = f"LZH Installer: {game.lzh_decompressor or 'detected'} ({len(game.lzh_archives)} archives)"
-            lzh_surf = self.font_small.render(lzh_info, True, ORANGE)
+            lzh_surf = self._render(self.font_small, lzh_info, ORANGE)
             self.screen.blit(lzh_surf, (60, y))
             y += 25
 
         # Executables section
         y = 200
-        exe_title = self.font_medium.render("Executables:", True, YELLOW)
+        exe_title = self._render(self.font_medium, "Executables:", YELLOW)
         self.screen.blit(exe_title, (50, y))
         y += 35
 
         if game.setup_exes:
-            setup_label = self.font_small.render("Setup/Install:", True, BLUE)
+            setup_label = self._render(self.font_small, "Setup/Install:", BLUE)
             self.screen.blit(setup_label, (70, y))
             y += 22
             for exe in game.setup_exes[:4]:
-                exe_surf = self.font_small.render(f"  {exe}", True, MIST_GRAY)
+                exe_surf = self._render(self.font_small, f"  {exe}", MIST_GRAY)
                 self.screen.blit(exe_surf, (70, y))
                 y += 20
             y += 8
 
         if game.game_exes:
-            game_label = self.font_small.render("Game:", True, GREEN)
+            game_label = self._render(self.font_small, "Game:", GREEN)
             self.screen.blit(game_label, (70, y))
             y += 22
             for exe in game.game_exes[:6]:
-                exe_surf = self.font_small.render(f"  {exe}", True, PALE_GRAY)
+                exe_surf = self._render(self.font_small, f"  {exe}", PALE_GRAY)
                 self.screen.blit(exe_surf, (70, y))
                 y += 20
 
@@ -762,7 +1222,7 @@ class DOSSetupUI:
         suggested = game.get_likely_game_exe()
         if suggested:
             y += 15
-            suggest_surf = self.font_small.render(f"Suggested autoboot: {suggested}", True, YELLOW)
+            suggest_surf = self._render(self.font_small, f"Suggested autoboot: {suggested}", YELLOW)
             self.screen.blit(suggest_surf, (50, y))
 
         # Help text panel
@@ -770,7 +1230,7 @@ class DOSSetupUI:
         self.screen.blit(help_panel, (50, self.height - 220))
 
         help_y = self.height - 210
-        help_title = self.font_small.render("DOSBox-Pure Keyboard Tips:", True, CYAN)
+        help_title = self._render(self.font_small, "DOSBox-Pure Keyboard Tips:", CYAN)
         self.screen.blit(help_title, (60, help_y))
 
         help_lines = [
@@ -780,7 +1240,7 @@ class DOSSetupUI:
             "SoundBlaster: Port 220, IRQ 7, DMA 1, High DMA 5"
         ]
         for i, line in enumerate(help_lines):
-            line_surf = self.font_tiny.render(line, True, MIST_GRAY)
+            line_surf = self._render(self.font_tiny, line, MIST_GRAY)
             self.screen.blit(line_surf, (70, help_y + 25 + i * 20))
 
         # Controls
@@ -788,15 +1248,16 @@ class DOSSetupUI:
             controls = "[A] Change Autoboot  [X] Launch  [Y] Launch  [R1] Clear Data  [B] Back"
         else:
             controls = "[A] Set Autoboot  [X] Launch (Setup)  [Y] Launch (Play)  [B] Back"
-        controls_surf = self.font_small.render(controls, True, MIST_GRAY)
+        controls_surf = self._render(self.font_small, controls, MIST_GRAY)
         self.screen.blit(controls_surf, (self.width // 2 - controls_surf.get_width() // 2, self.height - 40))
 
         draw_nerdymark_brand(self.screen, self.font_brand, ACCENT_DIM)
         self.draw_status()
+        return self.screen.get_rect()
 
-    def draw_exe_select(self):
+    def draw_exe_select(self) -> Optional[pygame.Rect]:
         if not self.selected_game:
-            return
+            return None
 
         self.background.update()
         self.background.draw(self.screen)
@@ -804,7 +1265,7 @@ class DOSSetupUI:
 
         draw_title_with_glow(self.screen, self.font_large, "SELECT EXECUTABLE", ACCENT, 15)
 
-        subtitle = self.font_medium.render(f"For: {game.name[:50]}", True, PALE_GRAY)
+        subtitle = self._render(self.font_medium, f"For: {game.name[:50]}", PALE_GRAY)
         self.screen.blit(subtitle, (self.width // 2 - subtitle.get_width() // 2, 60))
 
         # List panel
@@ -832,58 +1293,79 @@ class DOSSetupUI:
                 prefix = "[GAME]"
                 color = GREEN
 
-            prefix_surf = self.font_small.render(prefix, True, color)
+            prefix_surf = self._render(self.font_small, prefix, color)
             self.screen.blit(prefix_surf, (120, y + 6))
 
             exe_color = HIGHLIGHT if i == self.exe_select_index else PALE_GRAY
-            exe_surf = self.font_medium.render(exe, True, exe_color)
+            exe_surf = self._render(self.font_medium, exe, exe_color)
             self.screen.blit(exe_surf, (210, y + 4))
 
             y += 38
 
         controls = "[A] Select  [B] Cancel"
-        controls_surf = self.font_small.render(controls, True, MIST_GRAY)
+        controls_surf = self._render(self.font_small, controls, MIST_GRAY)
         self.screen.blit(controls_surf, (self.width // 2 - controls_surf.get_width() // 2, self.height - 40))
 
         draw_nerdymark_brand(self.screen, self.font_brand, ACCENT_DIM)
+        return self.screen.get_rect()
 
-    def draw_keyboard(self):
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((*VOID_BLACK, 220))
-        self.screen.blit(overlay, (0, 0))
-
+    def _build_keyboard(self):
+        """Composite the keyboard panel with every key unselected, plus the key rects"""
         kb_width = 600
         kb_height = 300
-        kb_x = (self.width - kb_width) // 2
-        kb_y = (self.height - kb_height) // 2
+        key_size = 50
 
-        kb_panel = create_panel(kb_width, kb_height, border_color=ACCENT_DIM)
-        self.screen.blit(kb_panel, (kb_x, kb_y))
+        self._kb_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA).convert_alpha()
+        self._kb_overlay.fill((*VOID_BLACK, 220))
 
-        search_surf = self.font_medium.render(f"Search: {self.search_text}_", True, ACCENT)
-        self.screen.blit(search_surf, (kb_x + 20, kb_y + 20))
+        self._kb_bg = create_panel(kb_width, kb_height, border_color=ACCENT_DIM).convert_alpha()
+        self._kb_pos = ((self.width - kb_width) // 2, (self.height - kb_height) // 2)
 
-        key_size = 50
+        # Key rects relative to the panel, indexed [row][col]
+        self._kb_key_rects = []
         for row_idx, row in enumerate(self.keyboard_rows):
             row_width = len(row) * (key_size + 5)
-            start_x = kb_x + (kb_width - row_width) // 2
-            y = kb_y + 70 + row_idx * (key_size + 5)
+            start_x = (kb_width - row_width) // 2
+            y = 70 + row_idx * (key_size + 5)
 
+            rects = []
             for col_idx, key in enumerate(row):
                 x = start_x + col_idx * (key_size + 5)
                 w = key_size
                 if key in ["SPACE", "DEL", "DONE"]:
                     w = 80
                     x = start_x + col_idx * 85
+                rect = pygame.Rect(x, y, w, key_size)
+                rects.append(rect)
+                self._draw_key(self._kb_bg, rect, key, False)
+            self._kb_key_rects.append(rects)
+
+    def _draw_key(self, surface: pygame.Surface, rect: pygame.Rect, key: str, selected: bool):
+        color = ACCENT if selected else SMOKE_GRAY
+        pygame.draw.rect(surface, color, rect, border_radius=5)
+
+        label = " " if key == "SPACE" else key
+        key_surf = self._render(self.font_small, label, VOID_BLACK if selected else PALE_GRAY)
+        surface.blit(key_surf, (rect.centerx - key_surf.get_width() // 2,
+                                rect.centery - key_surf.get_height() // 2))
+
+    def draw_keyboard(self) -> pygame.Rect:
+        if self._kb_bg is None:
+            self._build_keyboard()
 
-                selected = (row_idx == self.key_row and col_idx == self.key_col)
-                color = ACCENT if selected else SMOKE_GRAY
-                pygame.draw.rect(self.screen, color, (x, y, w, key_size), border_radius=5)
+        dirty = self.screen.blit(self._kb_overlay, (0, 0))
+        kb_x, kb_y = self._kb_pos
+        self.screen.blit(self._kb_bg, self._kb_pos)
+
+        search_surf = self._render(self.font_medium, f"Search: {self.search_text}_", ACCENT)
+        self.screen.blit(search_surf, (kb_x + 20, kb_y + 20))
+
+        # Only the selected key differs from the pre-composited panel
+        key = self.keyboard_rows[self.key_row][self.key_col]
+        rect = self._kb_key_rects[self.key_row][self.key_col].move(kb_x, kb_y)
+        self._draw_key(self.screen, rect, key, True)
 
-                label = " " if key == "SPACE" else key
-                key_surf = self.font_small.render(label, True, VOID_BLACK if selected else PALE_GRAY)
-                self.screen.blit(key_surf, (x + w // 2 - key_surf.get_width() // 2,
-                                            y + key_size // 2 - key_surf.get_height() // 2))
+        return dirty
 
     def launch_game(self, game: DOSGame):
         """Launch game in DOSBox-Pure via RetroArch"""
@@ -892,12 +1374,14 @@ class DOSSetupUI:
         pygame.display.flip()
         pygame.time.wait(2000)
 
-        cmd = f'{RETROARCH_CMD} -L "{DOSBOX_PURE_CORE}" "{game.zip_path}"'
+        cmd = RETROARCH_CMD + ['-L', DOSBOX_PURE_CORE, str(game.zip_path)]
         logger.info(f"Launching game: {game.name}")
-        logger.info(f"Command: {cmd}")
+        logger.info(f"Command: {' '.join(cmd)}")
 
         try:
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            # RetroArch output goes to a log file rather than being buffered in memory
+            with open(RETROARCH_LOG, 'a') as log_file:
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=log_file)
             logger.debug(f"RetroArch exit code: {result.returncode}")
 
             # Refresh game state
@@ -1030,127 +1514,181 @@ class DOSSetupUI:
         logger.info(f"Filter changed to: {self.filter_mode}")
         self.apply_filter()
 
-    def run(self):
-        os.makedirs(DOS_ROM_DIR, exist_ok=True)
-        os.makedirs(SAVES_DIR, exist_ok=True)
+    def _act_quit(self):
+        self.running = False
 
-        # Check for updates at startup
-        self.check_for_updates()
+    def _act_open_detail(self):
+        if self.filtered_games:
+            self.selected_game = self.filtered_games[self.selected_index]
+            self.view_mode = View.DETAIL
 
-        self.draw_loading("Starting up...")
-        pygame.display.flip()
-        self.load_games()
+    def _act_quick_config(self):
+        if self.filtered_games:
+            self.quick_config(self.filtered_games[self.selected_index])
 
-        if not self.games:
-            self.draw_loading("No DOS games found in roms/dos/")
-            pygame.display.flip()
-            pygame.time.wait(3000)
-            pygame.quit()
-            return 1
+    def _act_open_keyboard(self):
+        self.keyboard_active = True
+        self.key_row = 0
+        self.key_col = 0
 
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
+    def _act_close_keyboard(self):
+        self.keyboard_active = False
 
-                if event.type == pygame.KEYDOWN:
-                    if self.keyboard_active:
-                        if event.key == pygame.K_ESCAPE:
-                            self.keyboard_active = False
-                        elif event.key == pygame.K_RETURN:
-                            self.handle_keyboard_select()
-                    elif self.view_mode == "list":
-                        if event.key == pygame.K_ESCAPE:
-                            running = False
-                        elif event.key == pygame.K_RETURN and self.filtered_games:
-                            self.selected_game = self.filtered_games[self.selected_index]
-                            self.view_mode = "detail"
-                        elif event.key == pygame.K_y:
-                            self.keyboard_active = True
-                    elif self.view_mode == "detail":
-                        if event.key == pygame.K_ESCAPE:
-                            self.view_mode = "list"
-                    elif self.view_mode == "exe_select":
-                        if event.key == pygame.K_ESCAPE:
-                            self.view_mode = "detail"
-                        elif event.key == pygame.K_RETURN and self.selected_game:
-                            exe = self.selected_game.executables[self.exe_select_index]
-                            self.selected_game.set_autoboot(exe)
-                            self.set_status(f"Set autoboot: {exe}")
-                            self.view_mode = "detail"
+    def _act_update(self):
+        if self.update_banner_visible and self.update_checker.can_update:
+            self.perform_update()
 
-                if event.type == pygame.JOYBUTTONDOWN:
-                    if self.keyboard_active:
-                        if event.button == 0:
-                            self.handle_keyboard_select()
-                        elif event.button == 1:
-                            self.keyboard_active = False
-                    elif self.view_mode == "list":
-                        if event.button == 0 and self.filtered_games:
-                            self.selected_game = self.filtered_games[self.selected_index]
-                            self.view_mode = "detail"
-                        elif event.button == 1:
-                            running = False
-                        elif event.button == 2 and self.filtered_games:
-                            game = self.filtered_games[self.selected_index]
-                            self.quick_config(game)
-                        elif event.button == 3:
-                            self.keyboard_active = True
-                            self.key_row = 0
-                            self.key_col = 0
-                        elif event.button == 4:
-                            self.cycle_filter(-1)
-                        elif event.button == 5:
-                            self.cycle_filter(1)
-                        elif event.button == 6:  # SELECT - update
-                            if self.update_banner_visible and self.update_checker.can_update:
-                                self.perform_update()
-                    elif self.view_mode == "detail":
-                        if event.button == 0 and self.selected_game:
-                            self.exe_select_index = 0
-                            self.view_mode = "exe_select"
-                        elif event.button == 1:
-                            self.view_mode = "list"
-                        elif event.button == 2 and self.selected_game:
-                            self.launch_game(self.selected_game)
-                        elif event.button == 3 and self.selected_game:
-                            self.launch_game(self.selected_game)
-                        elif event.button == 5 and self.selected_game:  # R1 - clear save data
-                            if self.selected_game.clear_save_data():
-                                self.set_status("Save data cleared")
-                            else:
-                                self.set_status("Failed to clear save data")
-                    elif self.view_mode == "exe_select":
-                        if event.button == 0 and self.selected_game:
-                            exe = self.selected_game.executables[self.exe_select_index]
-                            self.selected_game.set_autoboot(exe)
-                            self.set_status(f"Set autoboot: {exe}")
-                            self.view_mode = "detail"
-                        elif event.button == 1:
-                            self.view_mode = "detail"
-
-            action = self.check_input()
-            if action:
+    def _act_open_exe_select(self):
+        if self.selected_game:
+            self.exe_select_index = 0
+            self.view_mode = View.EXE_SELECT
+
+    def _act_back_to_list(self):
+        self.view_mode = View.LIST
+
+    def _act_launch(self):
+        if self.selected_game:
+            self.launch_game(self.selected_game)
+
+    def _act_clear_save_data(self):
+        if self.selected_game:
+            if self.selected_game.clear_save_data():
+                self.set_status("Save data cleared")
+            else:
+                self.set_status("Failed to clear save data")
+
+    def _act_confirm_exe(self):
+        if self.selected_game:
+            exe = self.selected_game.executables[self.exe_select_index]
+            self.selected_game.set_autoboot(exe)
+            self.set_status(f"Set autoboot: {exe}")
+            self.view_mode = View.DETAIL
+
+    def _act_back_to_detail(self):
+        self.view_mode = View.DETAIL
+
+    def process_events(self, first: Optional[pygame.event.Event] = None):
+        events = pygame.event.get(HANDLED_EVENTS)
+        pygame.event.clear(pump=False)
+        # An event that woke the idle wait comes before anything queued after it
+        if first is not None and first.type in HANDLED_EVENTS:
+            events.insert(0, first)
+        for event in events:
+            self._needs_redraw = True
+
+            if event.type == pygame.QUIT:
+                self.running = False
+
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.prof.toggle()
+                continue
+
+            if event.type == pygame.KEYDOWN:
                 if self.keyboard_active:
-                    self.handle_keyboard_input(action)
-                elif self.view_mode == "list":
-                    self.handle_list_input(action)
-                elif self.view_mode == "exe_select":
-                    self.handle_exe_select_input(action)
-
-            if self.view_mode == "list":
-                self.draw_main_list()
+                    if event.key == pygame.K_ESCAPE:
+                        self._act_close_keyboard()
+                    elif event.key == pygame.K_RETURN:
+                        self.handle_keyboard_select()
+                elif self.view_mode == View.LIST:
+                    if event.key == pygame.K_ESCAPE:
+                        self._act_quit()
+                    elif event.key == pygame.K_RETURN:
+                        self._act_open_detail()
+                    elif event.key == pygame.K_y:
+                        self.keyboard_active = True
+                elif self.view_mode == View.DETAIL:
+                    if event.key == pygame.K_ESCAPE:
+                        self._act_back_to_list()
+                elif self.view_mode == View.EXE_SELECT:
+                    if event.key == pygame.K_ESCAPE:
+                        self._act_back_to_detail()
+                    elif event.key == pygame.K_RETURN:
+                        self._act_confirm_exe()
+
+            if event.type == pygame.JOYBUTTONDOWN:
                 if self.keyboard_active:
-                    self.draw_keyboard()
-            elif self.view_mode == "detail":
-                self.draw_detail_view()
-            elif self.view_mode == "exe_select":
-                self.draw_exe_select()
+                    handlers = self._kb_btn_handlers
+                else:
+                    handlers = self._btn_handlers[self.view_mode]
+                handler = handlers.get(event.button)
+                if handler:
+                    handler()
 
-            pygame.display.flip()
-            self.clock.tick(60)
+    def run(self):
+        os.makedirs(DOS_ROM_DIR, exist_ok=True)
+        os.makedirs(SAVES_DIR, exist_ok=True)
+
+        # Library loading overlaps the update check and the first frames
+        self.start_loading()
+
+        # Check for updates at startup
+        self.check_for_updates()
+
+        # Bound once; the loop body runs every frame
+        prof = self.prof
+        perf_counter = time.perf_counter
+        get_ticks = pygame.time.get_ticks
+        wait_event = pygame.event.wait
+        process_events = self.process_events
+        check_input = self.check_input
+        present = self.present
+        pace_frame = self.pace_frame
+        draw_fns = self._draw_fns
+        input_fns = self._input_fns
+        dirty_rects = self._dirty_rects
+
+        woke_event = None
+        self.running = True
+        while self.running:
+            frame_start = perf_counter()
+            if self._loaded_games is not None:
+                self.poll_loaded_games()
+                if not self.scanning and not self.games:
+                    self.draw_loading("No DOS games found in roms/dos/")
+                    pygame.display.flip()
+                    pygame.time.wait(3000)
+                    pygame.quit()
+                    return 1
+
+            with prof.span("events"):
+                process_events(woke_event)
+            woke_event = None
+
+            with prof.span("input"):
+                action = check_input()
+                if action:
+                    self._needs_redraw = True
+                    if self.keyboard_active:
+                        self.handle_keyboard_input(action)
+                    else:
+                        handler = input_fns[self.view_mode]
+                        if handler:
+                            handler(action)
+
+            # Idle frames only keep the background animating, at IDLE_FRAME_MS
+            now = get_ticks()
+            if not self._needs_redraw and now - self._last_draw_time < IDLE_FRAME_MS:
+                # Idle wakes aren't frames; keep them out of the overlay's per-frame times
+                prof.discard_frame()
+                # Sleep in SDL until input arrives or the next idle frame is due
+                woke_event = wait_event(IDLE_FRAME_MS - (now - self._last_draw_time))
+                continue
 
+            with prof.span("draw"):
+                dirty = draw_fns[self.view_mode]()
+                if dirty:
+                    dirty_rects.append(dirty)
+                if prof.enabled:
+                    dirty_rects.append(self.draw_profiler())
+
+            with prof.span("present"):
+                present()
+            self._needs_redraw = False
+            self._last_draw_time = now
+            prof.end_frame()
+            pace_frame(perf_counter() - frame_start)
+
+        self.save_games_cache()
         pygame.quit()
         return 0
 
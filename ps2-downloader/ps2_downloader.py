@@ -6,15 +6,24 @@ Uses pygame for Steam Deck controller-friendly UI
 """
 
 import pygame
-import subprocess
 import urllib.request
 import urllib.parse
-import html.parser
+import http.client
+import html
 import os
+import re
+import ctypes
+import select
 import sys
 import signal
 import atexit
 import time
+import threading
+import struct
+from array import array
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 
 # Add shared module path
@@ -29,10 +38,28 @@ from git_update import UpdateChecker
 BASE_URL = "https://myrient.erista.me/files/Redump/Sony%20-%20PlayStation%202/"
 PS2_ROM_DIR = "/run/media/deck/SK256/Emulation/roms/ps2"
 SOUND_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tada.mp3")
+ROM_EXTENSIONS = frozenset(('.zip', '.iso', '.chd', '.cso', '.zso'))
 
 # Disk space thresholds (in GB)
 DISK_SPACE_WARNING = 20  # Yellow when below 20GB
 DISK_SPACE_CRITICAL = 10  # Red when below 10GB
+DISK_SPACE_TTL = 2.0  # seconds to reuse a statvfs() result
+
+# List row suffix, indexed by a game's downloaded bit
+STATUS_LABELS = ("", "  [DOWNLOADED]")
+
+# Rendered text surfaces kept around between frames
+TEXT_CACHE_SIZE = 512
+
+# Download streaming
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # read1() returns whatever has arrived, up to this
+WRITE_QUEUE_DEPTH = 8  # chunks buffered between the socket reader and the disk writer
+PROGRESS_INTERVAL = 0.1  # seconds between progress redraws
+EVENT_POLL_INTERVAL = 1 / 60  # poll input at frame rate even when not redrawing
+IDLE_REDRAW_INTERVAL = 0.05  # redraw cadence for dialogs with nothing but the background moving
+MENU_BACKGROUND_INTERVAL = 0.05  # rain steps on the menu; input redraws just what changed
+DOWNLOAD_BACKGROUND_INTERVAL = 0.2  # rain steps while downloading, the old 5 Hz monitor rate
+DOWNLOAD_WORKERS = 3  # concurrent downloads for Download All - more gets throttled by Myrient
 
 # Colors - PS2 Blue theme
 THEME = get_theme('ps2')
@@ -51,8 +78,13 @@ YELLOW = (180, 170, 80)
 RED = (180, 70, 70)
 BLUE = ACCENT
 
-# Global tracking for cleanup
-_child_processes = []
+# Myrient directory listings are flat <a href="X.zip" ...>X.zip</a> rows, so one
+# byte regex over the page replaces an html.parser pass
+ZIP_LINK_RE = re.compile(rb'<a href="([^"]+\.zip)"[^>]*>\s*([^<]+?)\.zip\s*</a>')
+
+# Global tracking for cleanup - downloads run on threads, so each batch registers
+# its cancel Event here instead of a child process to kill
+_active_downloads = []
 _cleanup_done = False
 
 def cleanup():
@@ -60,16 +92,8 @@ def cleanup():
     if _cleanup_done:
         return
     _cleanup_done = True
-    for proc in _child_processes:
-        try:
-            proc.kill()
-            proc.wait(timeout=2)
-        except:
-            pass
-    try:
-        subprocess.run(['pkill', '-f', 'wget.*myrient'], capture_output=True, timeout=5)
-    except:
-        pass
+    for cancel in _active_downloads:
+        cancel.set()
 
 def signal_handler(signum, frame):
     cleanup()
@@ -80,33 +104,136 @@ signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 atexit.register(cleanup)
 
-def track_process(proc):
-    _child_processes.append(proc)
-    return proc
+def track_download(cancel):
+    _active_downloads.append(cancel)
+    return cancel
 
 
-class MyrientParser(html.parser.HTMLParser):
-    def __init__(self):
-        super().__init__()
-        self.games = []
-        self.in_link = False
-        self.current_href = None
-
-    def handle_starttag(self, tag, attrs):
-        if tag == 'a':
-            for name, value in attrs:
-                if name == 'href' and value.endswith('.zip'):
-                    self.in_link = True
-                    self.current_href = value
-
-    def handle_data(self, data):
-        if self.in_link and self.current_href:
-            name = data.strip()
-            if name.endswith('.zip'):
-                display_name = name[:-4]
-                self.games.append((display_name, self.current_href))
-            self.in_link = False
-            self.current_href = None
+# Per-thread keep-alive connections: a worker pulling several games in a row only pays
+# the TCP + TLS handshake for the first one
+_http_local = threading.local()
+
+
+def _http_connection(scheme, netloc):
+    conns = getattr(_http_local, 'conns', None)
+    if conns is None:
+        conns = _http_local.conns = {}
+    conn = conns.get((scheme, netloc))
+    if conn is None:
+        conn_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        conn = conns[(scheme, netloc)] = conn_class(netloc, timeout=30)
+    return conn
+
+
+def close_connections():
+    """Close this thread's keep-alive connections (after a partial read or error)"""
+    for conn in getattr(_http_local, 'conns', {}).values():
+        conn.close()
+
+
+def open_stream(url, max_redirects=5):
+    """GET url on this thread's keep-alive connection, following redirects. Returns the response."""
+    for _ in range(max_redirects + 1):
+        parts = urllib.parse.urlsplit(url)
+        conn = _http_connection(parts.scheme, parts.netloc)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        for attempt in range(2):
+            try:
+                conn.request('GET', path, headers={'User-Agent': 'Mozilla/5.0'})
+                response = conn.getresponse()
+                break
+            except ConnectionError:
+                # The server may have dropped our idle socket - reconnect once
+                conn.close()
+                if attempt:
+                    raise
+
+        if response.status in (301, 302, 303, 307, 308):
+            response.read()
+            url = urllib.parse.urljoin(url, response.getheader('Location', ''))
+            continue
+        if response.status != 200:
+            conn.close()
+            raise OSError(f"HTTP {response.status} for {url}")
+        return response
+    raise OSError(f"Too many redirects for {url}")
+
+
+def write_chunks(chunks, fd, errors):
+    """Writer thread: drain byte chunks from the queue to fd until a None sentinel"""
+    while True:
+        chunk = chunks.get()
+        if chunk is None:
+            return
+        if errors:
+            continue  # keep draining so the reader never blocks on a full queue
+        try:
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+        except OSError as e:
+            errors.append(e)
+
+
+class DirWatcher:
+    """Minimal inotify watch (via ctypes) that reports when a directory's entries change.
+
+    Inactive when inotify isn't available, in which case changed() is always False.
+    """
+
+    # From <sys/inotify.h>
+    IN_MOVED_FROM = 0x40
+    IN_MOVED_TO = 0x80
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+
+    # struct inotify_event header: wd, mask, cookie, len (then len bytes of name)
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self, path):
+        self.fd = -1
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return
+            mask = self.IN_CREATE | self.IN_DELETE | self.IN_MOVED_FROM | self.IN_MOVED_TO
+            if libc.inotify_add_watch(fd, os.fsencode(path), mask) < 0:
+                os.close(fd)
+                return
+            self.fd = fd
+        except (OSError, AttributeError):
+            self.fd = -1
+
+    def changed(self, ignore=()):
+        """True if entries were created, deleted or moved since the last call.
+
+        Events for names in ignore (files this process wrote itself) don't count.
+        """
+        if self.fd < 0:
+            return False
+        changed = False
+        header = self._EVENT
+        # select() first so a non-blocking read never has to raise BlockingIOError
+        while select.select([self.fd], [], [], 0)[0]:
+            buf = os.read(self.fd, 4096)
+            if not buf:
+                break
+            if changed:
+                continue
+            offset = 0
+            while offset < len(buf):
+                name_len = header.unpack_from(buf, offset)[3]
+                start = offset + header.size
+                offset = start + name_len
+                name = os.fsdecode(buf[start:offset].rstrip(b'\0'))
+                if name not in ignore:
+                    changed = True
+                    break
+        return changed
 
 
 class PS2DownloaderUI:
@@ -130,7 +257,8 @@ class PS2DownloaderUI:
         self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
         pygame.display.set_caption("nerdymark's PS2 Downloader")
 
-        # Fonts
+        # Fonts - pygame.font rather than pygame.freetype: the shared gloomy_aesthetic helpers
+        # call font.render(text, antialias, color), and SDL_ttf renders these labels much faster
         self.font_large = pygame.font.Font(None, 48)
         self.font_medium = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 28)
@@ -143,13 +271,20 @@ class PS2DownloaderUI:
             self.joystick.init()
 
         # State
-        self.games = []
-        self.filtered_games = []
+        # Game list as parallel arrays, built once by index_games
+        self._names = []
+        self._names_lower = []
+        self._display_names = []  # truncated for the list rows
+        self._hrefs = []
+        self._status_bits = bytearray()  # 1 = already downloaded
+        self._filtered_idx = array('i')  # indices into the arrays above, in list order
+        self._last_search = None
         self.existing_games = set()
         self.selected_index = 0
         self.scroll_offset = 0
         self.search_text = ""
         self.visible_items = (self.height - 200) // 40
+        self._disk_cache = (0, 0, -DISK_SPACE_TTL)  # (free_gb, total_gb, monotonic time read)
 
         # Download state
         self.downloading = False
@@ -158,6 +293,12 @@ class PS2DownloaderUI:
         self.download_speed = ""
         self.download_game_name = ""
         self.download_status = ""
+        self._progress = {}  # href -> [bytes_done, total_bytes], written by download workers
+        self._progress_lock = threading.Lock()
+        # Long-lived so each worker keeps its keep-alive connection between downloads
+        self._executor = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+        # ROM dir entries written by our own downloads, so the watcher doesn't rescan for them
+        self._own_writes = set()
 
         # Keyboard for search
         self.keyboard_active = False
@@ -174,24 +315,69 @@ class PS2DownloaderUI:
         # Input timing
         self.last_input_time = 0
         self.input_delay = 150  # ms
+        self.keys_pressed = pygame.key.get_pressed()  # refreshed by poll_events on key events
+        self._axis = [0.0, 0.0]  # left stick x/y, latched from JOYAXISMOTION
+        self._hat = (0, 0)  # D-pad, latched from JOYHATMOTION
+        self._woken_event = None  # event that woke an idle pygame.event.wait()
 
         # Gloomy background
         self.font_brand = pygame.font.Font(None, 24)
         self.background = GloomyBackground(self.width, self.height, accent_color=ACCENT)
 
+        # Surfaces that only depend on the screen size are built once
+        self._text_cache = OrderedDict()
+        self._search_panels = {
+            False: create_panel(self.width - 100, 40, border_color=SMOKE_GRAY),
+            True: create_panel(self.width - 100, 40, border_color=ACCENT_DIM),
+        }
+        self._list_panel = create_panel(self.width - 80, self.height - 230, border_color=SMOKE_GRAY)
+        self._highlight_surf = pygame.Surface((self.width - 100, 38), pygame.SRCALPHA)
+        pygame.draw.rect(self._highlight_surf, (*ACCENT_DIM, 120), (0, 0, self.width - 100, 38), border_radius=3)
+
+        # Partial redraws restore from the last full background frame
+        self._bg_cache = pygame.Surface((self.width, self.height)).convert()
+        self._bg_time = 0
+        self._screen_stale = True
+        self._search_rect = pygame.Rect(50, 100, self.width - 100, 40)
+        list_bottom = max(160 + self.visible_items * 40, self.height - 60)  # last row / scroll bar end
+        self._list_rect = pygame.Rect(0, 155, self.width, list_bottom - 155)
+        self._kb_rect = pygame.Rect((self.width - 600) // 2, (self.height - 300) // 2, 600, 300)
+        self.build_keyboard()
+        self._progress_rects = [
+            pygame.Rect(0, self.height // 2 - 60, self.width, 185),  # name, bar, speed, status
+            pygame.Rect(self.width - 150, 10, 150, 45),  # disk space
+        ]
+
         self.clock = pygame.time.Clock()
         # Git update checker
         self.update_checker = UpdateChecker()
         self.update_banner_visible = False
 
+    def _render(self, font, text, color):
+        """Render antialiased text, reusing the Surface from earlier frames"""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surf
+
     def get_existing_games(self):
         """Get list of already downloaded games"""
         existing = set()
-        rom_path = Path(PS2_ROM_DIR)
-        if rom_path.exists():
-            for f in rom_path.iterdir():
-                if f.suffix.lower() in ['.zip', '.iso', '.chd', '.cso', '.zso']:
-                    existing.add(f.stem)
+        try:
+            with os.scandir(PS2_ROM_DIR) as entries:
+                for entry in entries:
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot > 0 and name[dot:].lower() in ROM_EXTENSIONS:
+                        existing.add(name[:dot])
+        except FileNotFoundError:
+            pass
         return existing
 
     def fetch_game_list(self):
@@ -201,38 +387,63 @@ class PS2DownloaderUI:
         try:
             req = urllib.request.Request(BASE_URL, headers={'User-Agent': 'Mozilla/5.0'})
             with urllib.request.urlopen(req, timeout=30) as response:
-                html_content = response.read().decode('utf-8')
+                body = response.read()
 
-            parser = MyrientParser()
-            parser.feed(html_content)
-            return parser.games
+            return [
+                (html.unescape(m.group(2).decode('utf-8')), m.group(1).decode('utf-8'))
+                for m in ZIP_LINK_RE.finditer(body)
+            ]
         except Exception as e:
             self.draw_message("Error", f"Failed to fetch game list: {str(e)}")
             pygame.display.flip()
             pygame.time.wait(3000)
             return None
 
+    def index_games(self, games):
+        """Split the fetched (name, href) list into parallel arrays, lower-casing names once"""
+        self._names = [name for name, _ in games]
+        self._hrefs = [href for _, href in games]
+        self._names_lower = [name.lower() for name in self._names]
+        self._display_names = [name[:60] + "..." if len(name) > 60 else name for name in self._names]
+        self._filtered_idx = array('i', range(len(self._names)))
+        self._last_search = None
+        self.refresh_status()
+
+    def refresh_status(self):
+        """Recompute each game's downloaded flag from existing_games"""
+        existing = self.existing_games
+        self._status_bits = bytearray(name in existing for name in self._names)
+
     def filter_games(self):
         search = self.search_text.lower()
-        self.filtered_games = []
-        for name, href in self.games:
-            if search in name.lower():
-                status = "[DOWNLOADED]" if name in self.existing_games else ""
-                self.filtered_games.append((name, href, status))
+        names_lower = self._names_lower
+        # A longer query can only match a subset of what the previous one matched
+        if self._last_search is not None and search.startswith(self._last_search):
+            candidates = self._filtered_idx
+        else:
+            candidates = range(len(names_lower))
+        # Plain `in` on the pre-lowered names: CPython's substring search beats a compiled
+        # re.escape() matcher here for every query length (~1.5-2x over ~11k titles)
+        self._filtered_idx = array('i', [i for i in candidates if search in names_lower[i]])
+        self._last_search = search
         self.selected_index = 0
         self.scroll_offset = 0
 
     def get_disk_space(self):
-        """Get free disk space in GB for the ROM directory"""
+        """Get free disk space in GB for the ROM directory (cached for DISK_SPACE_TTL seconds)"""
+        now = time.monotonic()
+        if now - self._disk_cache[2] < DISK_SPACE_TTL:
+            return self._disk_cache[:2]
         try:
             stat = os.statvfs(PS2_ROM_DIR)
             free_bytes = stat.f_bavail * stat.f_frsize
             total_bytes = stat.f_blocks * stat.f_frsize
             free_gb = free_bytes / (1024 ** 3)
             total_gb = total_bytes / (1024 ** 3)
-            return free_gb, total_gb
         except:
-            return 0, 0
+            free_gb, total_gb = 0, 0
+        self._disk_cache = (free_gb, total_gb, now)
+        return free_gb, total_gb
 
     def draw_disk_space(self):
         """Draw disk space indicator in top-right corner"""
@@ -263,7 +474,7 @@ class PS2DownloaderUI:
         pygame.draw.rect(self.screen, GRAY, (x, y, bar_width, bar_height), width=1, border_radius=3)
 
         label = f"{free_gb:.0f}GB free"
-        label_surf = self.font_tiny.render(label, True, WHITE if free_gb >= DISK_SPACE_CRITICAL else fill_color)
+        label_surf = self._render(self.font_tiny, label, WHITE if free_gb >= DISK_SPACE_CRITICAL else fill_color)
         self.screen.blit(label_surf, (x, y + bar_height + 3))
 
     def play_completion_sound(self):
@@ -275,87 +486,127 @@ class PS2DownloaderUI:
                 pass
 
     def draw_message(self, title, message):
+        self._screen_stale = True
         self.background.update()
         self.background.draw(self.screen)
         draw_title_with_glow(self.screen, self.font_large, title, ACCENT, self.height//2 - 50)
-        msg_surf = self.font_medium.render(message, True, WHITE)
+        msg_surf = self._render(self.font_medium, message, WHITE)
         self.screen.blit(msg_surf, (self.width//2 - msg_surf.get_width()//2, self.height//2 + 10))
         draw_nerdymark_brand(self.screen, self.font_brand, ACCENT_DIM)
 
+    def menu_state(self):
+        """Snapshot of everything the menu screen depends on, for menu_dirty_rects()"""
+        return (self.keyboard_active, len(self._filtered_idx), self.update_banner_visible,
+                self.search_text, self.key_row, self.key_col,
+                self.scroll_offset, self.selected_index)
+
+    def menu_dirty_rects(self, before):
+        """Screen regions that changed since the menu_state() snapshot, or None for the whole screen"""
+        after = self.menu_state()
+        if before[:3] != after[:3]:
+            return None
+
+        rects = []
+        if before[3:6] != after[3:6]:
+            rects.append(self._search_rect)
+            if self.keyboard_active:
+                rects.append(self._kb_rect)
+        if before[6] != after[6]:
+            rects.append(self._list_rect)
+        elif before[7] != after[7]:
+            for index in (before[7], after[7]):
+                rects.append(pygame.Rect(40, 160 + (index - self.scroll_offset) * 40, self.width - 80, 40))
+        return rects
+
+    def render_frame(self, draw_fn, rects, background_interval):
+        """Draw draw_fn()'s UI over the background and push it to the display.
+
+        The rain only advances every background_interval seconds. Frames in between restore
+        just the given rects from the cached background, redraw the UI clipped to them and
+        update only those regions. rects=None forces a full frame.
+        """
+        now = time.monotonic()
+        if rects is None or self._screen_stale or now - self._bg_time >= background_interval:
+            self._screen_stale = False
+            self._bg_time = now
+            self.background.update()
+            self.background.draw(self._bg_cache)
+            self.screen.blit(self._bg_cache, (0, 0))
+            draw_fn()
+            pygame.display.flip()
+        elif rects:
+            for rect in rects:
+                self.screen.set_clip(rect)
+                self.screen.blit(self._bg_cache, rect, rect)
+                draw_fn()
+            self.screen.set_clip(None)
+            pygame.display.update(rects)
+
+    def draw_menu_frame(self):
+        self.draw_main_menu()
+        if self.keyboard_active:
+            self.draw_keyboard()
+
     def draw_main_menu(self):
-        self.background.update()
-        self.background.draw(self.screen)
         self.draw_disk_space()
 
         draw_title_with_glow(self.screen, self.font_large, "NERDYMARK'S PS2 DOWNLOADER", ACCENT, 20)
 
-        stats = f"{len(self.games)} games available | {len(self.existing_games)} downloaded | {len(self.filtered_games)} shown"
-        stats_surf = self.font_small.render(stats, True, PALE_GRAY)
+        stats = f"{len(self._names)} games available | {len(self.existing_games)} downloaded | {len(self._filtered_idx)} shown"
+        stats_surf = self._render(self.font_small, stats, PALE_GRAY)
         self.screen.blit(stats_surf, (self.width//2 - stats_surf.get_width()//2, 70))
 
-        search_panel = create_panel(self.width - 100, 40, border_color=ACCENT_DIM if self.keyboard_active else SMOKE_GRAY)
-        self.screen.blit(search_panel, (50, 100))
+        self.screen.blit(self._search_panels[self.keyboard_active], (50, 100))
         search_label = f"Search: {self.search_text}_" if not self.keyboard_active else f"Search: {self.search_text}"
-        search_surf = self.font_medium.render(search_label, True, HIGHLIGHT if self.keyboard_active else WHITE)
+        search_surf = self._render(self.font_medium, search_label, HIGHLIGHT if self.keyboard_active else WHITE)
         self.screen.blit(search_surf, (60, 108))
 
-        list_panel = create_panel(self.width - 80, self.height - 230, border_color=SMOKE_GRAY)
-        self.screen.blit(list_panel, (40, 155))
+        self.screen.blit(self._list_panel, (40, 155))
 
         list_top = 160
         for i in range(self.visible_items):
             idx = i + self.scroll_offset
-            if idx >= len(self.filtered_games):
+            if idx >= len(self._filtered_idx):
                 break
 
-            name, href, status = self.filtered_games[idx]
+            game = self._filtered_idx[idx]
+            status = self._status_bits[game]
+            display_name = self._display_names[game] + STATUS_LABELS[status]
             y = list_top + i * 40
 
             if idx == self.selected_index:
-                highlight_surface = pygame.Surface((self.width - 100, 38), pygame.SRCALPHA)
-                pygame.draw.rect(highlight_surface, (*ACCENT_DIM, 120), (0, 0, self.width - 100, 38), border_radius=3)
-                self.screen.blit(highlight_surface, (50, y))
-
-            display_name = name[:60] + "..." if len(name) > 60 else name
-            if status:
-                display_name += f"  {status}"
+                self.screen.blit(self._highlight_surf, (50, y))
 
             color = MIST_GRAY if status else PALE_GRAY
             if idx == self.selected_index:
                 color = HIGHLIGHT if status else ACCENT
 
-            text_surf = self.font_small.render(display_name, True, color)
+            text_surf = self._render(self.font_small, display_name, color)
             self.screen.blit(text_surf, (60, y + 8))
 
-        if len(self.filtered_games) > self.visible_items:
+        shown = len(self._filtered_idx)
+        if shown > self.visible_items:
             bar_height = self.height - 220
-            handle_height = max(30, bar_height * self.visible_items // len(self.filtered_games))
-            handle_pos = bar_height * self.scroll_offset // max(1, len(self.filtered_games) - self.visible_items)
+            handle_height = max(30, bar_height * self.visible_items // shown)
+            handle_pos = bar_height * self.scroll_offset // max(1, shown - self.visible_items)
             pygame.draw.rect(self.screen, DEEP_GRAY, (self.width - 30, 160, 10, bar_height), border_radius=5)
             pygame.draw.rect(self.screen, ACCENT_DIM, (self.width - 30, 160 + handle_pos, 10, handle_height), border_radius=5)
 
         controls = "[D-PAD] Navigate  [A] Download  [X] Download All  [Y] Search  [B] Quit"
-        controls_surf = self.font_small.render(controls, True, MIST_GRAY)
+        controls_surf = self._render(self.font_small, controls, MIST_GRAY)
         self.screen.blit(controls_surf, (self.width//2 - controls_surf.get_width()//2, self.height - 40))
 
         draw_nerdymark_brand(self.screen, self.font_brand, ACCENT_DIM)
         self.draw_update_banner()
 
-    def draw_keyboard(self):
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((*VOID_BLACK, 220))
-        self.screen.blit(overlay, (0, 0))
-
-        kb_width = 600
-        kb_height = 300
-        kb_x = (self.width - kb_width) // 2
-        kb_y = (self.height - kb_height) // 2
-        kb_panel = create_panel(kb_width, kb_height, border_color=ACCENT_DIM)
-        self.screen.blit(kb_panel, (kb_x, kb_y))
-
-        search_surf = self.font_medium.render(f"Search: {self.search_text}_", True, ACCENT)
-        self.screen.blit(search_surf, (kb_x + 20, kb_y + 20))
+    def build_keyboard(self):
+        """Lay out the on-screen keyboard once: overlay, panel and (rect, labels, row, col) per key"""
+        kb_x, kb_y, kb_width, kb_height = self._kb_rect
+        self._kb_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self._kb_overlay.fill((*VOID_BLACK, 220))
+        self._kb_panel = create_panel(kb_width, kb_height, border_color=ACCENT_DIM)
 
+        self._kb_keys = []
         key_size = 50
         for row_idx, row in enumerate(self.keyboard_rows):
             row_width = len(row) * (key_size + 5)
@@ -369,22 +620,30 @@ class PS2DownloaderUI:
                     w = 80
                     x = start_x + col_idx * 85
 
-                selected = (row_idx == self.key_row and col_idx == self.key_col)
-                color = ACCENT if selected else SMOKE_GRAY
-                pygame.draw.rect(self.screen, color, (x, y, w, key_size), border_radius=5)
-
                 label = " " if key == "SPACE" else key
-                key_surf = self.font_small.render(label, True, VOID_BLACK if selected else PALE_GRAY)
-                self.screen.blit(key_surf, (x + w//2 - key_surf.get_width()//2, y + key_size//2 - key_surf.get_height()//2))
+                label_selected = self.font_small.render(label, True, VOID_BLACK)
+                label_normal = self.font_small.render(label, True, PALE_GRAY)
+                self._kb_keys.append((pygame.Rect(x, y, w, key_size), label_selected, label_normal, row_idx, col_idx))
+
+    def draw_keyboard(self):
+        self.screen.blit(self._kb_overlay, (0, 0))
+        self.screen.blit(self._kb_panel, self._kb_rect.topleft)
+
+        search_surf = self._render(self.font_medium, f"Search: {self.search_text}_", ACCENT)
+        self.screen.blit(search_surf, (self._kb_rect.x + 20, self._kb_rect.y + 20))
+
+        for rect, label_selected, label_normal, row_idx, col_idx in self._kb_keys:
+            selected = (row_idx == self.key_row and col_idx == self.key_col)
+            pygame.draw.rect(self.screen, ACCENT if selected else SMOKE_GRAY, rect, border_radius=5)
+            key_surf = label_selected if selected else label_normal
+            self.screen.blit(key_surf, key_surf.get_rect(center=rect.center))
 
     def draw_download_progress(self):
-        self.background.update()
-        self.background.draw(self.screen)
         self.draw_disk_space()
 
         draw_title_with_glow(self.screen, self.font_large, "DOWNLOADING", ACCENT, self.height//2 - 120)
 
-        name_surf = self.font_medium.render(self.download_game_name[:50], True, PALE_GRAY)
+        name_surf = self._render(self.font_medium, self.download_game_name[:50], PALE_GRAY)
         self.screen.blit(name_surf, (self.width//2 - name_surf.get_width()//2, self.height//2 - 60))
 
         bar_width = self.width - 200
@@ -397,27 +656,53 @@ class PS2DownloaderUI:
         if fill_width > 0:
             pygame.draw.rect(self.screen, ACCENT_DIM, (bar_x, bar_y, fill_width, bar_height), border_radius=5)
 
-        pct_surf = self.font_medium.render(f"{self.download_progress}%", True, WHITE)
+        pct_surf = self._render(self.font_medium, f"{self.download_progress}%", WHITE)
         self.screen.blit(pct_surf, (self.width//2 - pct_surf.get_width()//2, bar_y + 8))
 
         if self.download_speed:
-            speed_surf = self.font_small.render(self.download_speed, True, MIST_GRAY)
+            speed_surf = self._render(self.font_small, self.download_speed, MIST_GRAY)
             self.screen.blit(speed_surf, (self.width//2 - speed_surf.get_width()//2, bar_y + 60))
 
-        status_surf = self.font_small.render(self.download_status, True, HIGHLIGHT)
+        status_surf = self._render(self.font_small, self.download_status, HIGHLIGHT)
         self.screen.blit(status_surf, (self.width//2 - status_surf.get_width()//2, bar_y + 100))
 
-        cancel_surf = self.font_small.render("[B] Cancel", True, (180, 70, 70))
+        cancel_surf = self._render(self.font_small, "[B] Cancel", (180, 70, 70))
         self.screen.blit(cancel_surf, (self.width//2 - cancel_surf.get_width()//2, self.height - 50))
 
         draw_nerdymark_brand(self.screen, self.font_brand, ACCENT_DIM)
 
+    def poll_events(self):
+        """Pump SDL once and drain the queue in one batch.
+
+        Key, stick and D-pad state are latched from the events here so check_input never
+        has to query SDL directly.
+        """
+        pygame.event.pump()
+        events = pygame.event.get(pump=False)
+        if self._woken_event is not None:
+            # Event that ended an idle wait comes first, as if it had never been taken off the queue
+            events.insert(0, self._woken_event)
+            self._woken_event = None
+        keys_changed = False
+        for event in events:
+            if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+                keys_changed = True
+            elif event.type == pygame.JOYAXISMOTION:
+                if event.axis < 2:
+                    self._axis[event.axis] = event.value
+            elif event.type == pygame.JOYHATMOTION:
+                if event.hat == 0:
+                    self._hat = event.value
+        if keys_changed:
+            self.keys_pressed = pygame.key.get_pressed()
+        return events
+
     def check_input(self):
         current_time = pygame.time.get_ticks()
         if current_time - self.last_input_time < self.input_delay:
             return None
 
-        keys = pygame.key.get_pressed()
+        keys = self.keys_pressed
         if keys[pygame.K_UP]:
             self.last_input_time = current_time
             return "UP"
@@ -432,7 +717,7 @@ class PS2DownloaderUI:
             return "RIGHT"
 
         if self.joystick:
-            hat = self.joystick.get_hat(0) if self.joystick.get_numhats() > 0 else (0, 0)
+            hat = self._hat
             if hat[1] == 1:
                 self.last_input_time = current_time
                 return "UP"
@@ -446,8 +731,7 @@ class PS2DownloaderUI:
                 self.last_input_time = current_time
                 return "RIGHT"
 
-            axis_y = self.joystick.get_axis(1)
-            axis_x = self.joystick.get_axis(0)
+            axis_x, axis_y = self._axis
             if axis_y < -0.5:
                 self.last_input_time = current_time
                 return "UP"
@@ -494,107 +778,172 @@ class PS2DownloaderUI:
                 if self.selected_index < self.scroll_offset:
                     self.scroll_offset = self.selected_index
         elif action == "DOWN":
-            if self.selected_index < len(self.filtered_games) - 1:
+            if self.selected_index < len(self._filtered_idx) - 1:
                 self.selected_index += 1
                 if self.selected_index >= self.scroll_offset + self.visible_items:
                     self.scroll_offset = self.selected_index - self.visible_items + 1
 
-    def download_game(self, game_name, href):
-        """Download a PS2 game - save the ZIP directly"""
-        self.downloading = True
-        self.download_game_name = game_name
-        self.download_progress = 0
-        self.download_speed = ""
-        self.download_status = "Starting download..."
+    def download_selected(self):
+        game = self._filtered_idx[self.selected_index]
+        return self.download_game(self._names[game], self._hrefs[game])
 
-        download_url = BASE_URL + href
-        filename = urllib.parse.unquote(href)
-        dest_path = os.path.join(PS2_ROM_DIR, filename)
+    def _fetch_game(self, href, dest_path, cancel):
+        """Stream one game to dest_path (runs on a worker thread). Returns True on success."""
+        if cancel.is_set():
+            return False
 
+        download_url = BASE_URL + href
+        downloaded = 0
+        total_size = 0
         try:
-            # Get file size first
-            total_size = 0
+            # Single streaming GET - Content-Length comes back with the body
+            with open_stream(download_url) as response:
+                total_size = int(response.headers.get('Content-Length') or 0)
+                # Only this worker writes its counter; the lock guards the dict, not the count
+                progress = [0, total_size]
+                with self._progress_lock:
+                    self._progress[href] = progress
+
+                # Hand chunks to a writer thread so SD card stalls don't hold up the socket
+                fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                chunks = queue.Queue(maxsize=WRITE_QUEUE_DEPTH)
+                write_errors = []
+                writer = threading.Thread(target=write_chunks, args=(chunks, fd, write_errors), daemon=True)
+                writer.start()
+                try:
+                    while not cancel.is_set() and not write_errors:
+                        chunk = response.read1(DOWNLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        chunks.put(chunk)
+                        downloaded += len(chunk)
+                        progress[0] = downloaded
+                finally:
+                    chunks.put(None)
+                    writer.join()
+                    os.close(fd)
+
+            success = (not cancel.is_set() and not write_errors
+                       and (not total_size or downloaded >= total_size))
+        except Exception:
+            success = False
+        finally:
+            with self._progress_lock:
+                self._progress.pop(href, None)
+
+        if not success:
+            # The socket may still hold part of the body, so it can't be reused
+            close_connections()
             try:
-                result = subprocess.run(
-                    ['curl', '-sI', '-L', download_url],
-                    capture_output=True, text=True, timeout=30
-                )
-                for line in result.stdout.split('\n'):
-                    if line.lower().startswith('content-length:'):
-                        total_size = int(line.split(':')[1].strip())
-            except:
+                os.remove(dest_path)
+            except FileNotFoundError:
                 pass
+        return success
 
-            # Start wget
-            proc = subprocess.Popen(
-                ['wget', '-O', dest_path, '-q', download_url],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-            track_process(proc)
-
-            # Monitor progress
-            cancelled = False
-            total_mb = total_size / (1024 * 1024) if total_size > 0 else 0
-
-            while proc.poll() is None:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        proc.kill()
-                        return False
-                    if event.type == pygame.JOYBUTTONDOWN:
-                        if event.button == 1:  # B button - cancel
-                            proc.kill()
-                            cancelled = True
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            proc.kill()
-                            cancelled = True
-
-                if cancelled:
-                    self.download_status = "Cancelled"
-                    if os.path.exists(dest_path):
-                        os.remove(dest_path)
-                    break
+    def _run_downloads(self, games):
+        """Download (name, href) pairs on the worker pool while keeping the UI live.
 
-                if os.path.exists(dest_path):
-                    size = os.path.getsize(dest_path)
-                    size_mb = size / (1024 * 1024)
-                    if total_mb > 0:
-                        self.download_progress = int((size / total_size) * 100)
-                        self.download_speed = f"{size_mb:.0f} / {total_mb:.0f} MB"
-                    else:
-                        self.download_speed = f"{size_mb:.0f} MB"
-
-                self.download_status = "Downloading..."
-                self.draw_download_progress()
-                pygame.display.flip()
-                self.clock.tick(5)
+        Returns the number of games that completed. B / Escape cancels everything in flight.
+        """
+        self.downloading = True
+        self._screen_stale = True
+        self.download_progress = 0
+        self.download_speed = ""
+        self.download_status = "Starting download..."
+        self.download_game_name = games[0][0]
+
+        cancel = track_download(threading.Event())
+        self._progress = {}
+        names = {}
+        dest_paths = {}
+        completed = 0
+        total = len(games)
+        cancelled = False
+        last_draw = 0
+        last_sig = None
+
+        pending = set()
+        for name, href in games:
+            dest_path = os.path.join(PS2_ROM_DIR, urllib.parse.unquote(href))
+            self._own_writes.add(os.path.basename(dest_path))
+            future = self._executor.submit(self._fetch_game, href, dest_path, cancel)
+            names[future] = name
+            dest_paths[future] = dest_path
+            pending.add(future)
+
+        while pending:
+            done, pending = wait(pending, timeout=EVENT_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.result():
+                    completed += 1
+                    # Same stem get_existing_games() would find, without rescanning the dir
+                    self.existing_games.add(Path(dest_paths[future]).stem)
+
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    cancelled = True
+                if event.type == pygame.JOYBUTTONDOWN:
+                    if event.button == 1:  # B button - cancel
+                        cancelled = True
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        cancelled = True
+
+            if cancelled:
+                cancel.set()
+                self.download_status = "Cancelled"
+
+            now = time.monotonic()
+            if now - last_draw < PROGRESS_INTERVAL:
+                continue
+            last_draw = now
+
+            with self._progress_lock:
+                active = list(self._progress.items())
+
+            if active:
+                active_names = [names[f] for f in pending if f.running()]
+                if active_names:
+                    self.download_game_name = active_names[0]
+                size = sum(done_bytes for _, (done_bytes, _) in active)
+                total_size = sum(size_bytes for _, (_, size_bytes) in active)
+                size_mb = size / (1024 * 1024)
+                if total_size > 0:
+                    self.download_progress = int((size / total_size) * 100)
+                    self.download_speed = f"{size_mb:.0f} / {total_size / (1024 * 1024):.0f} MB"
+                else:
+                    self.download_speed = f"{size_mb:.0f} MB"
 
-            if cancelled or proc.returncode != 0:
-                if os.path.exists(dest_path):
-                    os.remove(dest_path)
-                self.downloading = False
-                return False
+            if not cancelled:
+                if total > 1:
+                    self.download_status = f"Batch: {completed}/{total} ({len(active)} active)"
+                else:
+                    self.download_status = "Downloading..."
 
+            # Nothing visible changed: only the background step (if due) gets drawn
+            sig = (self.download_progress, self.download_speed, self.download_status, self.download_game_name)
+            rects = self._progress_rects if sig != last_sig else []
+            last_sig = sig
+            self.render_frame(self.draw_download_progress, rects, DOWNLOAD_BACKGROUND_INTERVAL)
+
+        if completed and not cancelled:
             self.download_progress = 100
-            self.download_status = "Complete!"
-            self.draw_download_progress()
-            pygame.display.flip()
+            self.download_status = "Complete!" if total == 1 else f"Batch: {completed}/{total} complete"
+            self.render_frame(self.draw_download_progress, self._progress_rects, DOWNLOAD_BACKGROUND_INTERVAL)
 
             self.play_completion_sound()
             pygame.time.wait(1000)
 
-        except Exception as e:
-            if os.path.exists(dest_path):
-                os.remove(dest_path)
-            self.downloading = False
-            return False
-
+        _active_downloads.remove(cancel)
         self.downloading = False
-        self.existing_games = self.get_existing_games()
+        self._screen_stale = True
+        self.refresh_status()
         self.filter_games()
-        return True
+        return completed
+
+    def download_game(self, game_name, href):
+        """Download a PS2 game - save the ZIP directly"""
+        return self._run_downloads([(game_name, href)]) == 1
 
     def draw_update_banner(self):
         """Draw update available notification banner at top of screen"""
@@ -626,33 +975,43 @@ class PS2DownloaderUI:
         """Show dialog offering to update. Returns True if user chose to update."""
         selected = 0
         options = ["Update Now", "Skip"]
+        self._screen_stale = True
+        redraw = True
+        last_draw = 0
 
         while True:
-            self.background.update()
-            self.background.draw(self.screen)
-            draw_title_with_glow(self.screen, self.font_large, "UPDATE AVAILABLE", ACCENT, self.height//2 - 100)
-
-            msg = f"{self.update_checker._status['behind']} new commits available"
-            msg_surf = self.font_medium.render(msg, True, PALE_GRAY)
-            self.screen.blit(msg_surf, (self.width//2 - msg_surf.get_width()//2, self.height//2 - 40))
-
-            for i, opt in enumerate(options):
-                y = self.height//2 + 20 + i * 50
-                color = ACCENT if i == selected else MIST_GRAY
-                opt_surf = self.font_medium.render(f"{'> ' if i == selected else '  '}{opt}", True, color)
-                self.screen.blit(opt_surf, (self.width//2 - opt_surf.get_width()//2, y))
-
-            draw_nerdymark_brand(self.screen, self.font_brand, ACCENT_DIM)
-            pygame.display.flip()
+            # Only the rain moves on its own, so idle frames redraw at a lower cadence
+            now = time.monotonic()
+            if redraw or now - last_draw >= IDLE_REDRAW_INTERVAL:
+                redraw = False
+                last_draw = now
+                self.background.update()
+                self.background.draw(self.screen)
+                draw_title_with_glow(self.screen, self.font_large, "UPDATE AVAILABLE", ACCENT, self.height//2 - 100)
+
+                msg = f"{self.update_checker._status['behind']} new commits available"
+                msg_surf = self.font_medium.render(msg, True, PALE_GRAY)
+                self.screen.blit(msg_surf, (self.width//2 - msg_surf.get_width()//2, self.height//2 - 40))
+
+                for i, opt in enumerate(options):
+                    y = self.height//2 + 20 + i * 50
+                    color = ACCENT if i == selected else MIST_GRAY
+                    opt_surf = self.font_medium.render(f"{'> ' if i == selected else '  '}{opt}", True, color)
+                    self.screen.blit(opt_surf, (self.width//2 - opt_surf.get_width()//2, y))
+
+                draw_nerdymark_brand(self.screen, self.font_brand, ACCENT_DIM)
+                pygame.display.flip()
 
-            for event in pygame.event.get():
+            for event in self.poll_events():
                 if event.type == pygame.QUIT:
                     return False
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_UP:
                         selected = max(0, selected - 1)
+                        redraw = True
                     elif event.key == pygame.K_DOWN:
                         selected = min(len(options) - 1, selected + 1)
+                        redraw = True
                     elif event.key == pygame.K_RETURN:
                         if selected == 0:
                             return self.perform_update()
@@ -667,16 +1026,18 @@ class PS2DownloaderUI:
                     elif event.button == 1:
                         return False
 
-            if self.joystick and self.joystick.get_numhats() > 0:
-                hat = self.joystick.get_hat(0)
+            if self.joystick:
+                hat = self._hat
                 if hat[1] == 1:
                     selected = max(0, selected - 1)
+                    redraw = True
                     pygame.time.wait(150)
                 elif hat[1] == -1:
                     selected = min(len(options) - 1, selected + 1)
+                    redraw = True
                     pygame.time.wait(150)
 
-            self.clock.tick(30)
+            self.clock.tick(60)
 
     def perform_update(self):
         """Perform the git update and show result"""
@@ -700,7 +1061,8 @@ class PS2DownloaderUI:
 
     def download_all(self):
         """Download all missing games from the filtered list"""
-        missing_games = [(name, href) for name, href, status in self.filtered_games if not status]
+        names, hrefs, status_bits = self._names, self._hrefs, self._status_bits
+        missing_games = [(names[i], hrefs[i]) for i in self._filtered_idx if not status_bits[i]]
         if not missing_games:
             self.draw_message("Download All", "No missing games to download!")
             pygame.display.flip()
@@ -708,15 +1070,9 @@ class PS2DownloaderUI:
             return
 
         total = len(missing_games)
-        for i, (name, href) in enumerate(missing_games):
-            self.download_status = f"Batch: {i+1}/{total}"
-            if not self.download_game(name, href):
-                # Check if user cancelled
-                for event in pygame.event.get():
-                    if event.type == pygame.JOYBUTTONDOWN and event.button == 1:
-                        return
-                    if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                        return
+        completed = self._run_downloads(missing_games)
+        if completed < total:
+            return
 
         self.draw_message("Download All", f"Completed! Downloaded {total} games.")
         pygame.display.flip()
@@ -724,22 +1080,33 @@ class PS2DownloaderUI:
 
     def run(self):
         os.makedirs(PS2_ROM_DIR, exist_ok=True)
+        rom_watch = DirWatcher(PS2_ROM_DIR)
 
         # Check for updates at startup
         self.check_for_updates()
 
         self.existing_games = self.get_existing_games()
-        self.games = self.fetch_game_list()
+        games = self.fetch_game_list()
 
-        if not self.games:
+        if not games:
             pygame.quit()
             return 1
 
+        self.index_games(games)
         self.filter_games()
 
         running = True
         while running:
-            for event in pygame.event.get():
+            # Only rescan the ROM dir when something actually changed in it
+            # Finished downloads are already in existing_games, so only outside changes count
+            if rom_watch.changed(self._own_writes):
+                self.existing_games = self.get_existing_games()
+                self.refresh_status()
+                self._screen_stale = True
+            self._own_writes.clear()
+
+            before = self.menu_state()
+            for event in self.poll_events():
                 if event.type == pygame.QUIT:
                     running = False
 
@@ -752,9 +1119,8 @@ class PS2DownloaderUI:
                     elif event.key == pygame.K_RETURN:
                         if self.keyboard_active:
                             self.handle_keyboard_select()
-                        elif self.filtered_games:
-                            name, href, status = self.filtered_games[self.selected_index]
-                            self.download_game(name, href)
+                        elif self._filtered_idx:
+                            self.download_selected()
                     elif event.key == pygame.K_y:
                         self.keyboard_active = True
                         self.key_row = 0
@@ -764,9 +1130,8 @@ class PS2DownloaderUI:
                     if event.button == 0:  # A button
                         if self.keyboard_active:
                             self.handle_keyboard_select()
-                        elif self.filtered_games:
-                            name, href, status = self.filtered_games[self.selected_index]
-                            self.download_game(name, href)
+                        elif self._filtered_idx:
+                            self.download_selected()
                     elif event.button == 1:  # B button
                         if self.keyboard_active:
                             self.keyboard_active = False
@@ -787,14 +1152,17 @@ class PS2DownloaderUI:
                 else:
                     self.handle_list_input(action)
 
-            if self.downloading:
-                self.draw_download_progress()
-            else:
-                self.draw_main_menu()
-                if self.keyboard_active:
-                    self.draw_keyboard()
-
-            pygame.display.flip()
+            rects = self.menu_dirty_rects(before)
+            self.render_frame(self.draw_menu_frame, rects, MENU_BACKGROUND_INTERVAL)
+
+            # Nothing changed: sleep in SDL until input arrives or the rain is due to step
+            if rects == [] and not self.keyboard_active:
+                idle_ms = int((MENU_BACKGROUND_INTERVAL - (time.monotonic() - self._bg_time)) * 1000) + 1
+                if idle_ms > 0:
+                    event = pygame.event.wait(idle_ms)
+                    if event.type != pygame.NOEVENT:
+                        self._woken_event = event
+                    continue
             self.clock.tick(60)
 
         pygame.quit()
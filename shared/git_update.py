@@ -7,32 +7,62 @@ Respects local changes - won't auto-update if there are uncommitted modification
 
 import subprocess
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 
 # Path to the git repository root
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# How long an update check result is reused before git is asked again (seconds)
+CHECK_TTL = 300
 
-def run_git_command(args, cwd=None):
-    """Run a git command and return (success, output)"""
+# Skip `git fetch` if the last one finished less than this long ago (seconds)
+MIN_FETCH_INTERVAL = 300
+
+# Last (monotonic time, status) from UpdateChecker, shared by every instance
+_last_check = None
+
+# Single background worker for update checks, created on first use
+_executor = None
+
+
+def run_git_command(args, cwd=None, strip=True, discard_output=False):
+    """
+    Run a git command and return (success, output)
+
+    With discard_output=True nothing is piped back and output is always ''.
+    """
     if cwd is None:
         cwd = REPO_ROOT
     try:
+        # --no-optional-locks keeps read-only commands like status from
+        # taking index.lock just to refresh the index
+        pipe = subprocess.DEVNULL if discard_output else subprocess.PIPE
         result = subprocess.run(
-            ['git'] + args,
+            ['git', '--no-optional-locks'] + args,
             cwd=cwd,
-            capture_output=True,
-            text=True,
+            stdout=pipe,
+            stderr=pipe,
             timeout=30
         )
-        return result.returncode == 0, result.stdout.strip()
+        if discard_output:
+            return result.returncode == 0, ''
+        # Paths in status output aren't guaranteed to be UTF-8
+        output = result.stdout.decode('utf-8', errors='replace')
+        return result.returncode == 0, output.strip() if strip else output
     except Exception as e:
         return False, str(e)
 
 
 def is_git_repo():
     """Check if we're in a git repository"""
-    success, _ = run_git_command(['rev-parse', '--git-dir'])
+    # A plain checkout has a .git directory, which is much cheaper to look
+    # for than running git. Worktrees and submodules use a .git file that
+    # points elsewhere, so leave those (and anything odd) to rev-parse.
+    if os.path.isdir(os.path.join(REPO_ROOT, '.git')):
+        return True
+    success, _ = run_git_command(['rev-parse', '--git-dir'], discard_output=True)
     return success
 
 
@@ -42,61 +72,120 @@ def get_current_branch():
     return output if success else None
 
 
-def has_local_changes():
-    """Check if there are any uncommitted changes (staged or unstaged)"""
-    # Check for staged changes
-    success, output = run_git_command(['diff', '--cached', '--quiet'])
-    if not success:
-        return True
+def _get_status_snapshot(untracked=False):
+    """
+    Run a single `git status` and return what the update check needs from it.
 
-    # Check for unstaged changes
-    success, output = run_git_command(['diff', '--quiet'])
+    Returns a dict with:
+        - branch: str or None - Current branch (None when detached or unknown)
+        - ahead, behind: int or None - Counts against the upstream (None without one)
+        - has_staged, has_unstaged, has_untracked: bool
+
+    Untracked files are only looked for when asked, since that means walking the
+    work tree. Submodules are ignored so git doesn't recurse into them.
+    """
+    snapshot = {
+        'branch': None,
+        'ahead': None,
+        'behind': None,
+        # Same answer the old `git diff --quiet` checks gave when git failed
+        'has_staged': True,
+        'has_unstaged': True,
+        'has_untracked': False
+    }
+    success, output = run_git_command([
+        '-c', 'status.submodulesummary=0',
+        'status', '--porcelain=v2', '--branch', '-z', '--no-renames',
+        '--ignore-submodules=all',
+        '--untracked-files=' + ('normal' if untracked else 'no')
+    ], strip=False)
     if not success:
-        return True
+        return snapshot
+
+    snapshot['has_staged'] = snapshot['has_unstaged'] = False
+    records = iter(output.split('\0'))
+    for record in records:
+        kind = record[:1]
+        if kind == '#':
+            key, _, value = record[2:].partition(' ')
+            if key == 'branch.head' and value != '(detached)':
+                snapshot['branch'] = value
+            elif key == 'branch.ab':
+                ahead, behind = value.split()
+                snapshot['ahead'], snapshot['behind'] = int(ahead), -int(behind)
+        elif kind == '?':
+            snapshot['has_untracked'] = True
+        elif kind in ('1', '2', 'u'):
+            x, y = record[2], record[3]
+            if x != '.':
+                snapshot['has_staged'] = True
+            if y != '.':
+                snapshot['has_unstaged'] = True
+            if kind == '2':
+                next(records, None)  # renames/copies are followed by the original path
+    return snapshot
 
-    return False
+
+def has_local_changes():
+    """Check if there are any uncommitted changes (staged or unstaged)"""
+    snapshot = _get_status_snapshot()
+    return snapshot['has_staged'] or snapshot['has_unstaged']
 
 
 def has_untracked_files():
     """Check if there are untracked files (excluding ignored)"""
-    success, output = run_git_command(['ls-files', '--others', '--exclude-standard'])
-    return bool(output.strip()) if success else False
+    return _get_status_snapshot(untracked=True)['has_untracked']
 
 
 def fetch_remote():
     """Fetch from origin to get latest refs"""
-    success, _ = run_git_command(['fetch', 'origin', '--quiet'])
+    success, _ = run_git_command(['fetch', 'origin', '--quiet'], discard_output=True)
     return success
 
 
-def get_commits_behind():
-    """Get number of commits we're behind origin"""
-    branch = get_current_branch()
-    if not branch:
-        return 0
+def seconds_since_fetch():
+    """Seconds since the last fetch (FETCH_HEAD mtime), or None if unknown"""
+    try:
+        mtime = os.stat(os.path.join(REPO_ROOT, '.git', 'FETCH_HEAD')).st_mtime
+    except OSError:
+        return None
+    return time.time() - mtime
 
-    success, output = run_git_command([
-        'rev-list', '--count', f'HEAD..origin/{branch}'
-    ])
 
-    if success and output.isdigit():
-        return int(output)
-    return 0
+def _get_ahead_behind(branch=None):
+    """
+    Get (ahead, behind) commit counts against the upstream branch with one rev-list.
 
+    Uses the configured upstream, falling back to origin/<branch> when none is set.
+    Passing branch means the upstream is already known to be missing.
+    """
+    success = False
+    if branch is None:
+        success, output = run_git_command([
+            'rev-list', '--left-right', '--count', 'HEAD...@{upstream}'
+        ])
+    if not success:
+        branch = branch or get_current_branch()
+        if not branch:
+            return 0, 0
+        success, output = run_git_command([
+            'rev-list', '--left-right', '--count', f'HEAD...origin/{branch}'
+        ])
 
-def get_commits_ahead():
-    """Get number of commits we're ahead of origin"""
-    branch = get_current_branch()
-    if not branch:
-        return 0
+    counts = output.split()
+    if success and len(counts) == 2 and all(c.isdigit() for c in counts):
+        return int(counts[0]), int(counts[1])
+    return 0, 0
 
-    success, output = run_git_command([
-        'rev-list', '--count', f'origin/{branch}..HEAD'
-    ])
 
-    if success and output.isdigit():
-        return int(output)
-    return 0
+def get_commits_behind():
+    """Get number of commits we're behind origin"""
+    return _get_ahead_behind()[1]
+
+
+def get_commits_ahead():
+    """Get number of commits we're ahead of origin"""
+    return _get_ahead_behind()[0]
 
 
 def pull_updates():
@@ -105,10 +194,13 @@ def pull_updates():
     return success, output
 
 
-def check_for_updates(fetch=True):
+def check_for_updates(fetch=True, min_fetch_interval=0):
     """
     Check if updates are available.
 
+    The fetch is skipped when the last one is less than min_fetch_interval
+    seconds old.
+
     Returns a dict with:
         - update_available: bool - True if we can safely update
         - behind: int - Number of commits behind
@@ -131,17 +223,24 @@ def check_for_updates(fetch=True):
         return result
 
     # Fetch latest from remote
+    if fetch and min_fetch_interval > 0:
+        age = seconds_since_fetch()
+        if age is not None and 0 <= age < min_fetch_interval:
+            fetch = False
     if fetch:
         if not fetch_remote():
             result['message'] = 'Could not fetch from remote'
             return result
 
-    # Check for local changes
-    result['has_changes'] = has_local_changes()
+    # Local changes and (usually) the commit counts come from one git status
+    snapshot = _get_status_snapshot()
+    result['has_changes'] = snapshot['has_staged'] or snapshot['has_unstaged']
 
     # Get commit counts
-    result['behind'] = get_commits_behind()
-    result['ahead'] = get_commits_ahead()
+    if snapshot['ahead'] is not None:
+        result['ahead'], result['behind'] = snapshot['ahead'], snapshot['behind']
+    else:
+        result['ahead'], result['behind'] = _get_ahead_behind(snapshot['branch'])
 
     # Determine if we can update
     if result['behind'] > 0:
@@ -177,6 +276,8 @@ def perform_update():
 
     success, output = pull_updates()
     if success:
+        global _last_check
+        _last_check = None
         return True, f"Updated successfully! Restart the tool to use the new version."
     else:
         return False, f"Update failed: {output}"
@@ -186,16 +287,27 @@ class UpdateChecker:
     """
     Helper class for UI integration.
     Caches update check results to avoid repeated git operations.
+    Results are shared between instances for CHECK_TTL seconds, and
+    `git fetch` is skipped if one ran within min_fetch_interval seconds.
     """
 
-    def __init__(self):
+    def __init__(self, min_fetch_interval=MIN_FETCH_INTERVAL):
         self._status = None
         self._checked = False
+        self.min_fetch_interval = min_fetch_interval
 
     def check(self, force=False):
-        """Check for updates (cached unless force=True)"""
+        """Check for updates (cached unless force=True, which also always fetches)"""
+        global _last_check
         if not self._checked or force:
-            self._status = check_for_updates()
+            now = time.monotonic()
+            if not force and _last_check and now - _last_check[0] < CHECK_TTL:
+                self._status = _last_check[1]
+            else:
+                self._status = check_for_updates(
+                    min_fetch_interval=0 if force else self.min_fetch_interval
+                )
+                _last_check = (now, self._status)
             self._checked = True
         return self._status
 
@@ -255,6 +367,7 @@ class UpdateUI:
         self.background = background
         self.checker = checker or UpdateChecker()
         self.banner_visible = False
+        self._banner_surface = None
         self.width = screen.get_width()
         self.height = screen.get_height()
 
@@ -268,11 +381,23 @@ class UpdateUI:
         Returns:
             True if tool should restart after update
         """
-        draw_message_fn("Checking for updates...", "Please wait")
         import pygame
-        pygame.display.flip()
+        global _executor
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1)
+
+        # git fetch goes over the network, so run the check in the background
+        # and keep the message (and its animated background) drawing meanwhile
+        future = _executor.submit(self.checker.check)
+        clock = pygame.time.Clock()
+        while not future.done():
+            draw_message_fn("Checking for updates...", "Please wait")
+            pygame.display.flip()
+            pygame.event.pump()
+            clock.tick(30)
 
-        status = self.checker.check()
+        status = future.result()
+        self._banner_surface = None
         if status['update_available']:
             self.banner_visible = True
             if status['can_update']:
@@ -284,18 +409,21 @@ class UpdateUI:
         if not self.banner_visible:
             return
 
-        import pygame
-        banner_height = 30
-        banner_surface = pygame.Surface((self.width, banner_height), pygame.SRCALPHA)
-        pygame.draw.rect(banner_surface, (80, 60, 20, 200), (0, 0, self.width, banner_height))
+        # The message is fixed once a check has run, so build the banner once
+        if self._banner_surface is None:
+            import pygame
+            banner_height = 30
+            banner_surface = pygame.Surface((self.width, banner_height), pygame.SRCALPHA)
+            pygame.draw.rect(banner_surface, (80, 60, 20, 200), (0, 0, self.width, banner_height))
 
-        msg = self.checker.message
-        if self.checker.can_update:
-            msg += " - Press SELECT to update"
+            msg = self.checker.message
+            if self.checker.can_update:
+                msg += " - Press SELECT to update"
 
-        text_surf = self.fonts['tiny'].render(msg, True, (255, 220, 100))
-        banner_surface.blit(text_surf, (self.width//2 - text_surf.get_width()//2, 6))
-        self.screen.blit(banner_surface, (0, 0))
+            text_surf = self.fonts['tiny'].render(msg, True, (255, 220, 100))
+            banner_surface.blit(text_surf, (self.width//2 - text_surf.get_width()//2, 6))
+            self._banner_surface = banner_surface
+        self.screen.blit(self._banner_surface, (0, 0))
 
     def offer_update_dialog(self, joystick=None):
         """
@@ -314,7 +442,25 @@ class UpdateUI:
         options = ["Update Now", "Skip"]
         clock = pygame.time.Clock()
 
+        # Dialog text only changes with the selection, so it is rendered
+        # once per change and just blitted over the animated background
+        msg = f"{self.checker.behind} new commits available"
+        msg_surf = self.fonts['medium'].render(msg, True, self.colors['pale_gray'])
+        msg_blit = (msg_surf, (self.width//2 - msg_surf.get_width()//2, self.height//2 - 40))
+        text_blits = None
+        rendered_for = None
+
         while True:
+            if rendered_for != selected:
+                text_blits = [msg_blit]
+                for i, opt in enumerate(options):
+                    y = self.height//2 + 20 + i * 50
+                    color = self.colors['accent'] if i == selected else self.colors['mist_gray']
+                    prefix = "> " if i == selected else "  "
+                    opt_surf = self.fonts['medium'].render(f"{prefix}{opt}", True, color)
+                    text_blits.append((opt_surf, (self.width//2 - opt_surf.get_width()//2, y)))
+                rendered_for = selected
+
             self.background.update()
             self.background.draw(self.screen)
 
@@ -322,17 +468,7 @@ class UpdateUI:
                 self.screen, self.fonts['large'], "UPDATE AVAILABLE",
                 self.colors['accent'], self.height//2 - 100
             )
-
-            msg = f"{self.checker.behind} new commits available"
-            msg_surf = self.fonts['medium'].render(msg, True, self.colors['pale_gray'])
-            self.screen.blit(msg_surf, (self.width//2 - msg_surf.get_width()//2, self.height//2 - 40))
-
-            for i, opt in enumerate(options):
-                y = self.height//2 + 20 + i * 50
-                color = self.colors['accent'] if i == selected else self.colors['mist_gray']
-                prefix = "> " if i == selected else "  "
-                opt_surf = self.fonts['medium'].render(f"{prefix}{opt}", True, color)
-                self.screen.blit(opt_surf, (self.width//2 - opt_surf.get_width()//2, y))
+            self.screen.blits(text_blits, False)
 
             draw_nerdymark_brand(self.screen, self.fonts['brand'], self.colors['accent_dim'])
             pygame.display.flip()
@@ -8,6 +8,7 @@ Post-vaporwave aesthetic: dimly backlit skyline, fog, rain effects
 import pygame
 import random
 import math
+from functools import lru_cache
 
 # Base dark palette
 VOID_BLACK = (8, 8, 12)
@@ -36,6 +37,12 @@ HOPE_YELLOW = (220, 210, 100)
 RAIN_COLOR = (100, 110, 130, 80)
 PUDDLE_COLOR = (40, 45, 60)
 
+# Transparent key for the pre-rendered skyline (never produced by the palette)
+SKYLINE_KEY = (255, 0, 255)
+
+# Window brightness is quantized to this many levels (one color per level)
+WINDOW_LEVELS = 16
+
 
 class RainDrop:
     """A single rain drop particle"""
@@ -63,6 +70,26 @@ class RainDrop:
         pygame.draw.line(surface, color[:3], (self.x, self.y), (self.x + 2, end_y), 1)
 
 
+def _display_format(surface):
+    """Convert a cached surface to the display's pixel format, once a display exists"""
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+@lru_cache(maxsize=32)
+def _make_radial_fog(radius, alpha):
+    """Render one fog blob (concentric translucent circles) centred in its own surface"""
+    sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    for r in range(0, radius, 20):
+        ring_alpha = int(alpha * (1 - r / radius))
+        if ring_alpha > 0:
+            pygame.draw.circle(sprite, (100, 105, 120, ring_alpha), (radius, radius), radius - r)
+    return _display_format(sprite)
+
+
 class FogLayer:
     """Animated fog effect"""
     def __init__(self, width, height, density=0.3):
@@ -88,14 +115,27 @@ class FogLayer:
                 blob['x'] = -blob['radius']
 
     def draw(self, surface):
-        fog_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         for blob in self.blobs:
-            for r in range(0, blob['radius'], 20):
-                alpha = int(blob['alpha'] * (1 - r / blob['radius']))
-                if alpha > 0:
-                    pygame.draw.circle(fog_surface, (100, 105, 120, alpha),
-                                      (int(blob['x']), int(blob['y'])), blob['radius'] - r)
-        surface.blit(fog_surface, (0, 0))
+            radius = blob['radius']
+            sprite = _make_radial_fog(radius, blob['alpha'])
+            surface.blit(sprite, (int(blob['x']) - radius, int(blob['y']) - radius))
+
+
+# Sized for every glow_color one accent cycles through (at most 30 across the themes)
+@lru_cache(maxsize=32)
+def _make_skyline_glow(width, glow_color):
+    """Render the upper half of the skyline backlight over VOID_BLACK"""
+    # The ellipses are blended over the background one at a time, exactly as
+    # they used to be drawn per frame; compositing them on a transparent
+    # surface first comes out visibly brighter with alphas this low
+    glow = pygame.Surface((width, 60))
+    glow.fill(VOID_BLACK)
+    for i in range(60, 0, -2):
+        alpha = int(15 * (i / 60))
+        layer = pygame.Surface((width, i * 2), pygame.SRCALPHA)
+        pygame.draw.ellipse(layer, (*glow_color, alpha), (0, 0, width, i * 2))
+        glow.blit(layer, (0, 60 - i))
+    return _display_format(glow)
 
 
 class Skyline:
@@ -105,6 +145,11 @@ class Skyline:
         self.height = height
         self.buildings = self._generate_buildings()
         self.glow_offset = 0
+        # Buildings, windows and ground are pre-rendered; only windows that
+        # flickered since the last draw get repainted into the cache
+        self._baked = None
+        self._baked_accent = None
+        self._changed_windows = set()
 
     def _generate_buildings(self):
         buildings = []
@@ -129,7 +174,7 @@ class Skyline:
                     windows.append({
                         'x': wx,
                         'y': wy,
-                        'brightness': random.uniform(0.3, 1.0),
+                        'level': round(random.uniform(0.3, 1.0) * (WINDOW_LEVELS - 1)),
                         'flicker': random.random() < 0.1
                     })
         return windows
@@ -137,46 +182,87 @@ class Skyline:
     def update(self):
         self.glow_offset += 0.02
         # Flicker some windows
-        for building in self.buildings:
-            for window in building['windows']:
+        for bi, building in enumerate(self.buildings):
+            for wi, window in enumerate(building['windows']):
                 if window['flicker'] and random.random() < 0.05:
-                    window['brightness'] = random.uniform(0.2, 1.0)
-
-    def draw(self, surface, accent_color):
-        base_y = self.height - 100  # Skyline base position
-
-        # Draw dim backlight glow
-        glow_intensity = 0.3 + 0.1 * math.sin(self.glow_offset)
-        glow_color = tuple(int(c * glow_intensity * 0.3) for c in accent_color)
-        for i in range(60, 0, -2):
-            alpha = int(15 * (i / 60))
-            glow_surface = pygame.Surface((self.width, i * 2), pygame.SRCALPHA)
-            pygame.draw.ellipse(glow_surface, (*glow_color, alpha),
-                               (0, 0, self.width, i * 2))
-            surface.blit(glow_surface, (0, base_y - i))
-
-        # Draw buildings
-        for building in self.buildings:
+                    window['level'] = round(random.uniform(0.2, 1.0) * (WINDOW_LEVELS - 1))
+                    self._changed_windows.add((bi, wi))
+
+    def _draw_buildings(self, target, buildings):
+        """Draw building silhouettes, lit windows and the ground onto the baked surface"""
+        base_y = self.height - 100 - self._baked_top
+        window_colors = self._window_colors
+        for building in buildings:
             bx = building['x']
             bw = building['width']
             bh = building['height']
             by = base_y - bh
 
             # Building silhouette
-            pygame.draw.rect(surface, DEEP_GRAY, (bx, by, bw, bh))
-            pygame.draw.rect(surface, SMOKE_GRAY, (bx, by, bw, bh), 1)
+            pygame.draw.rect(target, DEEP_GRAY, (bx, by, bw, bh))
+            pygame.draw.rect(target, SMOKE_GRAY, (bx, by, bw, bh), 1)
 
             # Lit windows
             for window in building['windows']:
                 wx = bx + window['x']
                 wy = by + window['y']
-                brightness = window['brightness']
-                window_color = tuple(int(c * brightness * 0.6) for c in accent_color)
-                pygame.draw.rect(surface, window_color, (wx, wy, 6, 8))
+                pygame.draw.rect(target, window_colors[window['level']], (wx, wy, 6, 8))
 
         # Ground line with puddle reflections
-        pygame.draw.rect(surface, PUDDLE_COLOR, (0, base_y, self.width, 100))
-        pygame.draw.line(surface, SMOKE_GRAY, (0, base_y), (self.width, base_y), 2)
+        pygame.draw.rect(target, PUDDLE_COLOR, (0, base_y, self.width, 100))
+        pygame.draw.line(target, SMOKE_GRAY, (0, base_y), (self.width, base_y), 2)
+
+    def _bake(self, accent_color):
+        """Pre-render the whole skyline for one accent color"""
+        # Silhouettes and windows go into the same surface, in building
+        # order: neighbouring buildings overlap, so a silhouette-only layer
+        # with the windows drawn on top would show windows that should be
+        # hidden behind the next building
+        self._window_colors = [
+            tuple(int(c * (level / (WINDOW_LEVELS - 1)) * 0.6) for c in accent_color)
+            for level in range(WINDOW_LEVELS)
+        ]
+        self._baked_top = self.height - 100 - max(b['height'] for b in self.buildings)
+        self._baked = _display_format(pygame.Surface((self.width, self.height - self._baked_top)))
+        self._baked.fill(SKYLINE_KEY)
+        self._baked.set_colorkey(SKYLINE_KEY)
+        self._draw_buildings(self._baked, self.buildings)
+        self._baked_accent = accent_color
+        self._changed_windows.clear()
+
+    def _repaint_windows(self):
+        """Repaint flickered windows, redrawing anything in front of them too"""
+        base_y = self.height - 100 - self._baked_top
+        for bi, wi in self._changed_windows:
+            building = self.buildings[bi]
+            window = building['windows'][wi]
+            wx = building['x'] + window['x']
+            self._baked.set_clip((wx, base_y - building['height'] + window['y'], 6, 8))
+            # Later buildings can overlap this one, so they are redrawn on top
+            self._draw_buildings(self._baked, [
+                b for b in self.buildings[bi:] if b['x'] < wx + 6 and b['x'] + b['width'] > wx
+            ])
+        self._baked.set_clip(None)
+        self._changed_windows.clear()
+
+    def draw(self, surface, accent_color):
+        base_y = self.height - 100  # Skyline base position
+
+        # Draw dim backlight glow
+        glow_intensity = 0.3 + 0.1 * math.sin(self.glow_offset)
+        glow_color = tuple(int(c * glow_intensity * 0.3) for c in accent_color)
+        # Only the half above base_y is visible; the ground covers the rest.
+        # glow_color cycles through 12-30 values depending on the accent, all
+        # of which fit the cache, so each is rendered once and reused. Skyline is drawn straight after
+        # the VOID_BLACK fill, so the opaque pre-rendered strip is exact.
+        surface.blit(_make_skyline_glow(self.width, glow_color), (0, base_y - 60))
+
+        # Buildings, windows and ground from the cache
+        if self._baked is None or accent_color != self._baked_accent:
+            self._bake(accent_color)
+        elif self._changed_windows:
+            self._repaint_windows()
+        surface.blit(self._baked, (0, self._baked_top))
 
 
 class GloomyBackground:
@@ -200,7 +286,7 @@ class GloomyBackground:
 
     def _render_static(self):
         """Pre-render elements that don't change much"""
-        self.static_surface = pygame.Surface((self.width, self.height))
+        self.static_surface = _display_format(pygame.Surface((self.width, self.height)))
         self.static_surface.fill(VOID_BLACK)
 
     def update(self):
@@ -219,7 +305,9 @@ class GloomyBackground:
         # Fog layer
         self.fog.draw(surface)
 
-        # Rain
+        # Rain (batching the drops into one surface.blits() call with
+        # pre-drawn streak sprites measured no faster than these lines;
+        # Surface.fblits only exists in pygame-ce, not the pygame we ship)
         for drop in self.rain:
             drop.draw(surface)
 
@@ -227,6 +315,29 @@ class GloomyBackground:
         self.accent_color = color
 
 
+@lru_cache(maxsize=256)
+def _render_text(font, text, color, alpha=None):
+    """Render antialiased text once per (font, text, color, alpha) and reuse it"""
+    text_surf = font.render(text, True, color)
+    if alpha is not None:
+        text_surf.set_alpha(alpha)
+    return text_surf
+
+
+# Offsets the brand glow is stamped at to fake a halo
+BRAND_GLOW_OFFSETS = [(-1, -1), (1, -1), (-1, 1), (1, 1), (0, -2), (0, 2), (-2, 0), (2, 0)]
+
+
+@lru_cache(maxsize=16)
+def _render_brand_halo(font, text, glow_color):
+    """Stamp the glow text at every halo offset into one surface, 2px padded each side"""
+    glow_surf = _render_text(font, text, glow_color)
+    halo = pygame.Surface((glow_surf.get_width() + 4, glow_surf.get_height() + 4), pygame.SRCALPHA)
+    for ox, oy in BRAND_GLOW_OFFSETS:
+        halo.blit(glow_surf, (2 + ox, 2 + oy))
+    return halo
+
+
 def draw_nerdymark_brand(surface, font, accent_color, position="bottom_right"):
     """Draw the nerdymark branding"""
     width = surface.get_width()
@@ -237,10 +348,10 @@ def draw_nerdymark_brand(surface, font, accent_color, position="bottom_right"):
 
     # Glow layer
     glow_color = tuple(max(0, c - 60) for c in accent_color)
-    glow_surf = font.render(brand_text, True, glow_color)
+    halo = _render_brand_halo(font, brand_text, glow_color)
 
     # Main text
-    text_surf = font.render(brand_text, True, accent_color)
+    text_surf = _render_text(font, brand_text, tuple(accent_color))
 
     # Position
     if position == "bottom_right":
@@ -257,28 +368,42 @@ def draw_nerdymark_brand(surface, font, accent_color, position="bottom_right"):
         y = 15
 
     # Draw glow (offset slightly)
-    for ox, oy in [(-1, -1), (1, -1), (-1, 1), (1, 1), (0, -2), (0, 2), (-2, 0), (2, 0)]:
-        surface.blit(glow_surf, (x + ox, y + oy))
+    surface.blit(halo, (x - 2, y - 2))
 
     # Draw main text
     surface.blit(text_surf, (x, y))
 
 
+@lru_cache(maxsize=32)
+def _render_title_glow(font, text, glow_color):
+    """Stack the title's glow layers into one surface.
+
+    Every layer is the same colour, so starting from that colour at zero alpha
+    keeps the RGB put and only accumulates coverage, as the separate blits did.
+    """
+    glow = None
+    # The outermost layer has zero alpha, so it is skipped
+    for offset in range(3, 0, -1):
+        glow_surf = _render_text(font, text, glow_color, 60 - offset * 15)
+        if glow is None:
+            glow = pygame.Surface(glow_surf.get_size(), pygame.SRCALPHA)
+            glow.fill((*glow_color, 0))
+        glow.blit(glow_surf, (0, 0))
+    return glow
+
+
 def draw_title_with_glow(surface, font, text, accent_color, y_pos, center_x=None):
     """Draw a title with glow effect"""
     if center_x is None:
         center_x = surface.get_width() // 2
 
-    # Glow layers
-    for offset in range(4, 0, -1):
-        glow_alpha = 60 - offset * 15
-        glow_color = tuple(max(0, min(255, c - 40)) for c in accent_color)
-        glow_surf = font.render(text, True, glow_color)
-        glow_surf.set_alpha(glow_alpha)
-        surface.blit(glow_surf, (center_x - glow_surf.get_width() // 2, y_pos))
+    # Glow layers, pre-stacked
+    glow_color = tuple(max(0, min(255, c - 40)) for c in accent_color)
+    glow_surf = _render_title_glow(font, text, glow_color)
+    surface.blit(glow_surf, (center_x - glow_surf.get_width() // 2, y_pos))
 
     # Main text
-    text_surf = font.render(text, True, accent_color)
+    text_surf = _render_text(font, text, tuple(accent_color))
     surface.blit(text_surf, (center_x - text_surf.get_width() // 2, y_pos))
 
 
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 """Quick button mapping test for Steam Deck"""
+from collections import deque
+
 import pygame
 pygame.init()
 pygame.joystick.init()
@@ -13,36 +15,41 @@ if pygame.joystick.get_count() > 0:
     js = pygame.joystick.Joystick(0)
     js.init()
 
-last_buttons = []
+# Title and hint never change, so render them once
+title = font.render("Press A, B, X, Y buttons", True, (100, 200, 100))
+hint = font.render("Press ESC or close window to exit", True, (128, 128, 128))
+
+last_buttons = deque(maxlen=8)  # most recent presses; oldest drops off
 running = True
-clock = pygame.time.Clock()
+redraw = True
 
 while running:
-    for event in pygame.event.get():
+    if redraw:
+        screen.fill((0, 0, 0))
+
+        screen.blit(title, (150, 50))
+        screen.blit(hint, (120, 100))
+
+        y = 200
+        for btn in last_buttons:
+            text = font.render(btn, True, (255, 255, 255))
+            screen.blit(text, (300, y))
+            y += 45
+
+        pygame.display.flip()
+        redraw = False
+
+    # The screen only changes on a button press, so sleep until an event
+    # arrives instead of redrawing at a fixed frame rate
+    for event in [pygame.event.wait()] + pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
         if event.type == pygame.JOYBUTTONDOWN:
             last_buttons.append(f"Button {event.button}")
-            if len(last_buttons) > 8:
-                last_buttons.pop(0)
+            redraw = True
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            redraw = True
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             running = False
 
-    screen.fill((0, 0, 0))
-
-    title = font.render("Press A, B, X, Y buttons", True, (100, 200, 100))
-    screen.blit(title, (150, 50))
-
-    hint = font.render("Press ESC or close window to exit", True, (128, 128, 128))
-    screen.blit(hint, (120, 100))
-
-    y = 200
-    for btn in last_buttons:
-        text = font.render(btn, True, (255, 255, 255))
-        screen.blit(text, (300, y))
-        y += 45
-
-    pygame.display.flip()
-    clock.tick(30)
-
 pygame.quit()